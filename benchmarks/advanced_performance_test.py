@@ -3,144 +3,293 @@ Advanced performance benchmarking for Quicksort implementations.
 """
 
 import time
-import random
-import statistics
-import matplotlib.pyplot as plt
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, TYPE_CHECKING
 import sys
 import os
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from quicksort import quicksort, quicksort_inplace, quicksort_optimized
-from advanced_quicksort import AdvancedQuicksort, quicksort_advanced, quicksort_introsort, quicksort_parallel
+from quicksort import quicksort_python, quicksort_inplace, quicksort_optimized
+from advanced_quicksort import AdvancedQuicksort
+from utils import timing_stats
+from qs_numba import NUMBA_AVAILABLE, quicksort_numba, warm_up
+
+try:
+    from quicksort_cy import quicksort_cy
+except ImportError:
+    quicksort_cy = None  # Not built; see src/quicksort_cy.pyx
+
+_INT32 = np.iinfo(np.int32)
+
+# Runs shorter than this are batched so timer resolution does not dominate
+MIN_TIMED_NS = 50_000
+
+# Below this size 'Parallel Quicksort' runs serially; thread start-up
+# would otherwise dominate the measurement
+PARALLEL_MIN_SIZE = 5000
+
+# Per-algorithm warm-up and timed runs; caches are primed once per input
+WARMUP_RUNS = 1
+TIMED_RUNS = 7
+
+
+def numpy_sort(arr: np.ndarray) -> np.ndarray:
+    """
+    Sort with NumPy's quicksort kind.
+    
+    On NumPy >= 1.25 running on AVX-512 hardware (AVX2 from NumPy 2.0) this
+    dispatches to the x86-simd-sort vectorized quicksort; int32 input packs
+    16 lanes per register. Other builds use NumPy's scalar introsort.
+    """
+    return np.sort(arr, kind='quicksort')
+
+
+def array_dtype(arr: List[int]) -> type:
+    """Return the narrowest of int32/int64 that holds every value in arr."""
+    if arr and _INT32.min <= min(arr) and max(arr) <= _INT32.max:
+        return np.int32
+    return np.int64
 
 
 class PerformanceBenchmark:
     """Comprehensive performance benchmarking suite."""
     
     def __init__(self):
+        # The list sorters are pinned to their pure-Python code paths;
+        # integer input would otherwise be delegated to np.sort
+        python_sorter = AdvancedQuicksort(backend='python')
         self.sorters = {
-            'Basic Quicksort': quicksort,
-            'In-place Quicksort': lambda x: quicksort_inplace(x[:]) or x[:],
+            'Basic Quicksort': quicksort_python,
+            'In-place Quicksort': lambda x: quicksort_inplace(x, 0, len(x) - 1) or x,
             'Optimized Quicksort': quicksort_optimized,
-            'Advanced Quicksort': quicksort_advanced,
-            'Introsort': quicksort_introsort,
-            'Parallel Quicksort': quicksort_parallel,
+            'Advanced Quicksort': python_sorter.sort,
+            'Introsort': python_sorter.introsort,
+            'Parallel Quicksort': lambda x: (python_sorter.parallel_quicksort(x) if len(x) >= PARALLEL_MIN_SIZE
+                                             else python_sorter.sort(x)),
             'Python Built-in': sorted
         }
+        if quicksort_cy is not None:
+            self.sorters['Cython Quicksort'] = quicksort_cy
         
+        # Sorters that operate on an integer ndarray instead of a list
+        self.array_sorters = {'NumPy Sort': numpy_sort}
+        if NUMBA_AVAILABLE:
+            # Compile the kernel now so JIT time is never measured
+            warm_up()
+            self.array_sorters['Numba Quicksort'] = quicksort_numba
+        self.sorters.update(self.array_sorters)
+        self.algorithm_names = list(self.sorters)
+        
+        self._rng = np.random.default_rng(0)
         self.results = {}
     
     def generate_test_data(self, size: int, data_type: str = 'random') -> List[int]:
         """Generate test data of specified type."""
-        if data_type == 'random':
-            return [random.randint(1, size * 10) for _ in range(size)]
-        elif data_type == 'sorted':
+        if data_type == 'sorted':
             return list(range(size))
         elif data_type == 'reverse':
-            return list(range(size, 0, -1))
+            return np.arange(size, 0, -1, dtype=np.int64).tolist()
         elif data_type == 'nearly_sorted':
-            arr = list(range(size))
-            # Swap 1% of elements
-            for _ in range(max(1, size // 100)):
-                i, j = random.sample(range(size), 2)
-                arr[i], arr[j] = arr[j], arr[i]
-            return arr
+            arr = np.arange(size, dtype=np.int64)
+            # Swap 1% of elements using disjoint index pairs
+            swaps = max(1, size // 100)
+            idx = self._rng.choice(size, size=2 * swaps, replace=False)
+            i, j = idx[:swaps], idx[swaps:]
+            arr[i], arr[j] = arr[j], arr[i]
+            return arr.tolist()
         elif data_type == 'duplicates':
-            return [random.randint(1, size // 10) for _ in range(size)]
+            return self._rng.integers(1, max(size // 10, 1), size=size,
+                                      endpoint=True, dtype=np.int64).tolist()
         else:
-            return [random.randint(1, size * 10) for _ in range(size)]
+            return self._rng.integers(1, size * 10, size=size,
+                                      endpoint=True, dtype=np.int64).tolist()
     
-    def benchmark_single(self, arr: List[int], algorithm_name: str, 
-                        algorithm_func) -> Dict[str, Any]:
-        """Benchmark a single algorithm on given data."""
+    def benchmark_single(self, arr: List[int], expected: List[int], algorithm_name: str, 
+                        algorithm_func, master: np.ndarray = None) -> Dict[str, Any]:
+        """
+        Benchmark a single algorithm on given data.
+        
+        ``expected`` is the sorted reference for ``arr``; the first timed
+        result is checked against it. Array-based sorters are fed from a
+        preallocated buffer refreshed with np.copyto; pass ``master`` to
+        reuse one converted array across them.
+        """
+        if algorithm_name in self.array_sorters:
+            if master is None:
+                master = np.asarray(arr, dtype=array_dtype(arr))
+            buffers = []
+            
+            def fresh_copies(n: int) -> List[np.ndarray]:
+                while len(buffers) < n:
+                    buffers.append(np.empty_like(master))
+                for buf in buffers[:n]:
+                    np.copyto(buf, master)
+                return buffers[:n]
+        else:
+            def fresh_copies(n: int) -> List[List[int]]:
+                return [arr.copy() for _ in range(n)]
+        
         # Warm up
-        for _ in range(3):
-            algorithm_func(arr[:])
+        for _ in range(WARMUP_RUNS):
+            algorithm_func(fresh_copies(1)[0])
         
-        # Actual benchmark
+        # Actual benchmark, timed in integer nanoseconds
         times = []
-        memory_usage = []
+        batch = 1
         
-        for _ in range(5):
-            test_arr = arr[:]
+        for i in range(TIMED_RUNS):
+            test_arrs = fresh_copies(batch)
             
             # Measure time
-            start_time = time.perf_counter()
-            result = algorithm_func(test_arr)
-            end_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
+            for test_arr in test_arrs:
+                result = algorithm_func(test_arr)
+            elapsed_ns = time.perf_counter_ns() - start_ns
             
-            # Verify correctness
-            assert result == sorted(arr), f"Algorithm {algorithm_name} failed"
+            # Verify correctness on the first run only
+            if i == 0:
+                if isinstance(result, np.ndarray):
+                    correct = np.array_equal(result, expected)
+                else:
+                    correct = result == expected
+                assert correct, f"Algorithm {algorithm_name} failed"
+                
+                # Too fast to time reliably: batch the remaining runs
+                if elapsed_ns < MIN_TIMED_NS:
+                    batch = max(1, MIN_TIMED_NS // max(elapsed_ns, 1))
             
-            times.append(end_time - start_time)
-        
-        return {
-            'mean_time': statistics.mean(times),
-            'median_time': statistics.median(times),
-            'std_time': statistics.stdev(times) if len(times) > 1 else 0,
-            'min_time': min(times),
-            'max_time': max(times)
-        }
+            times.append(elapsed_ns / len(test_arrs))
+        
+        return {name: value / 1e9 for name, value in timing_stats(times).items()}
+    
+    def _bench_cell(self, test_data: List[int]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Benchmark every sorter on one (size, data_type) input.
+        
+        Returns:
+            Tuple of (results by algorithm, error messages by algorithm).
+            Failed algorithms have a result of None.
+        """
+        # Shared by every sorter in the cell; also primes caches on the input
+        for _ in range(2):
+            expected = sorted(test_data)
+        master = np.asarray(test_data, dtype=array_dtype(test_data))
+        cell = {}
+        errors = {}
+        
+        for algo_name, algo_func in self.sorters.items():
+            try:
+                cell[algo_name] = self.benchmark_single(
+                    test_data, expected, algo_name, algo_func, master
+                )
+            except Exception as e:
+                cell[algo_name] = None
+                errors[algo_name] = str(e)
+        
+        return cell, errors
     
     def run_comprehensive_benchmark(self, sizes: List[int] = None, 
-                                  data_types: List[str] = None) -> Dict[str, Any]:
-        """Run comprehensive benchmark across different sizes and data types."""
+                                  data_types: List[str] = None,
+                                  workers: int = None) -> Dict[str, Any]:
+        """
+        Run comprehensive benchmark across different sizes and data types.
+        
+        Each (size, data_type) cell is independent, so cells are distributed
+        over ``workers`` processes (default: one per CPU), each pinned to its
+        own core where the OS supports it. Use ``workers=1`` to run serially
+        in the current process.
+        """
         if sizes is None:
             sizes = [100, 1000, 5000, 10000, 50000]
         
         if data_types is None:
             data_types = ['random', 'sorted', 'reverse', 'nearly_sorted', 'duplicates']
         
-        results = {}
+        if workers is None:
+            workers = os.cpu_count() or 1
         
-        for size in sizes:
-            results[size] = {}
-            for data_type in data_types:
+        # Generate inputs here so they do not depend on worker scheduling
+        cells = [(size, data_type, self.generate_test_data(size, data_type))
+                 for size in sizes for data_type in data_types]
+        results = {size: {data_type: {} for data_type in data_types} for size in sizes}
+        
+        if workers <= 1:
+            for size, data_type, test_data in cells:
                 print(f"Benchmarking size {size}, type {data_type}...")
-                
-                test_data = self.generate_test_data(size, data_type)
-                results[size][data_type] = {}
-                
-                for algo_name, algo_func in self.sorters.items():
-                    try:
-                        benchmark_result = self.benchmark_single(
-                            test_data, algo_name, algo_func
-                        )
-                        results[size][data_type][algo_name] = benchmark_result
-                        print(f"  {algo_name}: {benchmark_result['mean_time']:.4f}s")
-                    except Exception as e:
-                        print(f"  {algo_name}: Failed - {str(e)}")
-                        results[size][data_type][algo_name] = None
+                cell, errors = self._bench_cell(test_data)
+                results[size][data_type] = cell
+                _print_cell(cell, errors)
+        else:
+            # Spawn rather than fork so workers never inherit the parent's
+            # threads (such as the shared parallel sort pool)
+            mp_context = multiprocessing.get_context('spawn')
+            cpu_ids = mp_context.Queue()
+            for cpu in _available_cpus():
+                cpu_ids.put(cpu)
+            
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                     initializer=_init_worker,
+                                     initargs=(cpu_ids,)) as executor:
+                futures = [executor.submit(_run_cell, *cell) for cell in cells]
+                for future in as_completed(futures):
+                    size, data_type, cell, errors = future.result()
+                    print(f"Benchmarked size {size}, type {data_type}:")
+                    results[size][data_type] = cell
+                    _print_cell(cell, errors)
         
         self.results = results
         return results
     
     def create_performance_plots(self, output_dir: str = 'benchmark_results'):
-        """Create performance visualization plots."""
+        """
+        Create performance visualization plots.
+        
+        Plots are rendered with the object-oriented Figure API on the Agg
+        canvas, reusing one Figure, so no pyplot state or GUI backend is
+        involved and this works on headless machines.
+        """
+        # Imported here so benchmarking alone never loads matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
         os.makedirs(output_dir, exist_ok=True)
         
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        
         # Plot 1: Performance vs Array Size
-        self._plot_size_performance(output_dir)
+        self._plot_size_performance(fig, output_dir)
         
         # Plot 2: Performance by Data Type
-        self._plot_data_type_performance(output_dir)
+        self._plot_data_type_performance(fig, output_dir)
         
         # Plot 3: Algorithm Comparison
-        self._plot_algorithm_comparison(output_dir)
+        self._plot_algorithm_comparison(fig, output_dir)
         
         # Plot 4: Speedup Analysis
-        self._plot_speedup_analysis(output_dir)
+        self._plot_speedup_analysis(fig, output_dir)
     
-    def _plot_size_performance(self, output_dir: str):
+    @staticmethod
+    def _new_axes(fig: 'Figure', figsize: Tuple[float, float]):
+        """Clear the shared figure, resize it and return fresh axes."""
+        fig.clf()
+        fig.set_size_inches(*figsize)
+        return fig.subplots()
+    
+    def _plot_size_performance(self, fig: 'Figure', output_dir: str):
         """Plot performance vs array size."""
-        plt.figure(figsize=(12, 8))
+        ax = self._new_axes(fig, (12, 8))
         
         sizes = sorted(self.results.keys())
-        for algo_name in self.sorters.keys():
+        for algo_name in self.algorithm_names:
             times = []
             for size in sizes:
                 # Use random data for this plot
@@ -154,166 +303,198 @@ class PerformanceBenchmark:
             valid_sizes = [s for s, t in zip(sizes, times) if t is not None]
             
             if valid_times:
-                plt.plot(valid_sizes, valid_times, marker='o', label=algo_name)
-        
-        plt.xlabel('Array Size')
-        plt.ylabel('Time (seconds)')
-        plt.title('Performance vs Array Size (Random Data)')
-        plt.legend()
-        plt.grid(True)
-        plt.xscale('log')
-        plt.yscale('log')
-        plt.savefig(os.path.join(output_dir, 'performance_vs_size.png'))
-        plt.close()
+                ax.plot(valid_sizes, valid_times, marker='o', label=algo_name)
+        
+        ax.set_xlabel('Array Size')
+        ax.set_ylabel('Time (seconds)')
+        ax.set_title('Performance vs Array Size (Random Data)')
+        ax.legend()
+        ax.grid(True)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        fig.savefig(os.path.join(output_dir, 'performance_vs_size.png'))
     
-    def _plot_data_type_performance(self, output_dir: str):
+    def _plot_data_type_performance(self, fig: 'Figure', output_dir: str):
         """Plot performance by data type."""
-        plt.figure(figsize=(15, 10))
+        ax = self._new_axes(fig, (15, 10))
         
         data_types = ['random', 'sorted', 'reverse', 'nearly_sorted', 'duplicates']
-        algorithms = list(self.sorters.keys())
+        algorithms = self.algorithm_names
         
         # Use a representative size (e.g., 10000)
         target_size = 10000
         if target_size not in self.results:
             target_size = max(self.results.keys())
         
-        data = []
-        for algo in algorithms:
-            row = []
-            for data_type in data_types:
-                if (self.results[target_size].get(data_type) and 
-                    self.results[target_size][data_type].get(algo)):
-                    row.append(self.results[target_size][data_type][algo]['mean_time'])
-                else:
-                    row.append(0)
-            data.append(row)
+        size_results = self.results[target_size]
+        data = np.zeros((len(algorithms), len(data_types)))
+        for j, data_type in enumerate(data_types):
+            type_results = size_results.get(data_type) or {}
+            for i, algo in enumerate(algorithms):
+                result = type_results.get(algo)
+                if result:
+                    data[i, j] = result['mean_time']
         
         # Create heatmap
-        data = np.array(data)
-        plt.imshow(data, cmap='hot', interpolation='nearest', aspect='auto')
-        plt.colorbar(label='Time (seconds)')
-        plt.xticks(range(len(data_types)), data_types, rotation=45)
-        plt.yticks(range(len(algorithms)), algorithms)
-        plt.title(f'Performance by Data Type (Size: {target_size})')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'performance_by_data_type.png'))
-        plt.close()
+        image = ax.imshow(data, cmap='hot', interpolation='nearest', aspect='auto')
+        fig.colorbar(image, ax=ax, label='Time (seconds)')
+        ax.set_xticks(range(len(data_types)))
+        ax.set_xticklabels(data_types, rotation=45)
+        ax.set_yticks(range(len(algorithms)))
+        ax.set_yticklabels(algorithms)
+        ax.set_title(f'Performance by Data Type (Size: {target_size})')
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'performance_by_data_type.png'))
     
-    def _plot_algorithm_comparison(self, output_dir: str):
+    def _plot_algorithm_comparison(self, fig: 'Figure', output_dir: str):
         """Plot detailed algorithm comparison."""
-        plt.figure(figsize=(15, 10))
+        ax = self._new_axes(fig, (15, 10))
         
         # Use largest size for comparison
         max_size = max(self.results.keys())
         
-        algorithms = list(self.sorters.keys())
-        times = []
-        stds = []
+        algorithms = self.algorithm_names
+        times = np.zeros(len(algorithms))
+        stds = np.zeros(len(algorithms))
         
-        for algo in algorithms:
-            if (self.results[max_size]['random'] and 
-                self.results[max_size]['random'].get(algo)):
-                times.append(self.results[max_size]['random'][algo]['mean_time'])
-                stds.append(self.results[max_size]['random'][algo]['std_time'])
-            else:
-                times.append(0)
-                stds.append(0)
+        random_results = self.results[max_size].get('random') or {}
+        for i, algo in enumerate(algorithms):
+            result = random_results.get(algo)
+            if result:
+                times[i] = result['mean_time']
+                stds[i] = result['std_time']
         
         x_pos = np.arange(len(algorithms))
         
-        plt.bar(x_pos, times, yerr=stds, capsize=5, alpha=0.7)
-        plt.xlabel('Algorithm')
-        plt.ylabel('Time (seconds)')
-        plt.title(f'Algorithm Performance Comparison (Size: {max_size})')
-        plt.xticks(x_pos, algorithms, rotation=45, ha='right')
-        plt.grid(True, axis='y')
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'algorithm_comparison.png'))
-        plt.close()
+        ax.bar(x_pos, times, yerr=stds, capsize=5, alpha=0.7)
+        ax.set_xlabel('Algorithm')
+        ax.set_ylabel('Time (seconds)')
+        ax.set_title(f'Algorithm Performance Comparison (Size: {max_size})')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(algorithms, rotation=45, ha='right')
+        ax.grid(True, axis='y')
+        fig.tight_layout()
+        fig.savefig(os.path.join(output_dir, 'algorithm_comparison.png'))
     
-    def _plot_speedup_analysis(self, output_dir: str):
+    def _plot_speedup_analysis(self, fig: 'Figure', output_dir: str):
         """Plot speedup analysis."""
-        plt.figure(figsize=(12, 8))
+        ax = self._new_axes(fig, (12, 8))
         
         # Compare advanced algorithms to built-in sort
         sizes = sorted(self.results.keys())
         
+        random_results = [self.results[size].get('random') or {} for size in sizes]
+        
         for algo_name in ['Advanced Quicksort', 'Introsort', 'Parallel Quicksort']:
-            speedups = []
-            for size in sizes:
-                if (self.results[size]['random'] and 
-                    self.results[size]['random'].get(algo_name) and
-                    self.results[size]['random'].get('Python Built-in')):
-                    
-                    built_in_time = self.results[size]['random']['Python Built-in']['mean_time']
-                    algo_time = self.results[size]['random'][algo_name]['mean_time']
-                    speedups.append(built_in_time / algo_time if algo_time > 0 else 0)
-                else:
-                    speedups.append(0)
+            speedups = np.zeros(len(sizes))
+            for k, size_results in enumerate(random_results):
+                built_in = size_results.get('Python Built-in')
+                result = size_results.get(algo_name)
+                if built_in and result and result['mean_time'] > 0:
+                    speedups[k] = built_in['mean_time'] / result['mean_time']
             
-            plt.plot(sizes, speedups, marker='o', label=f'{algo_name} vs Built-in')
-        
-        plt.axhline(y=1, color='r', linestyle='--', label='Equal Performance')
-        plt.xlabel('Array Size')
-        plt.ylabel('Speedup (Built-in / Algorithm)')
-        plt.title('Speedup Analysis vs Python Built-in Sort')
-        plt.legend()
-        plt.grid(True)
-        plt.savefig(os.path.join(output_dir, 'speedup_analysis.png'))
-        plt.close()
+            ax.plot(sizes, speedups, marker='o', label=f'{algo_name} vs Built-in')
+        
+        ax.axhline(y=1, color='r', linestyle='--', label='Equal Performance')
+        ax.set_xlabel('Array Size')
+        ax.set_ylabel('Speedup (Built-in / Algorithm)')
+        ax.set_title('Speedup Analysis vs Python Built-in Sort')
+        ax.legend()
+        ax.grid(True)
+        fig.savefig(os.path.join(output_dir, 'speedup_analysis.png'))
     
     def generate_report(self, output_dir: str = 'benchmark_results'):
         """Generate comprehensive benchmark report."""
         os.makedirs(output_dir, exist_ok=True)
         
         report_path = os.path.join(output_dir, 'benchmark_report.md')
+        sorted_sizes = sorted(self.results.keys())
         
-        with open(report_path, 'w') as f:
-            f.write("# Quicksort Performance Benchmark Report\n\n")
-            f.write("## Executive Summary\n\n")
-            f.write("This report presents comprehensive performance analysis of various Quicksort implementations.\n\n")
-            
-            f.write("## Test Configuration\n\n")
-            f.write("- **Test Sizes**: " + ", ".join(map(str, sorted(self.results.keys()))) + "\n")
-            f.write("- **Data Types**: random, sorted, reverse, nearly_sorted, duplicates\n")
-            f.write("- **Iterations per test**: 5\n")
-            f.write("- **Hardware**: Standard Python environment\n\n")
-            
-            f.write("## Results Summary\n\n")
-            
+        lines = [
+            "# Quicksort Performance Benchmark Report\n\n",
+            "## Executive Summary\n\n",
+            "This report presents comprehensive performance analysis of various Quicksort implementations.\n\n",
+            "## Test Configuration\n\n",
+            "- **Test Sizes**: " + ", ".join(map(str, sorted_sizes)) + "\n",
+            "- **Data Types**: random, sorted, reverse, nearly_sorted, duplicates\n",
+            f"- **Iterations per test**: {TIMED_RUNS}\n",
+            f"- **Parallel Quicksort**: serial Advanced Quicksort below size {PARALLEL_MIN_SIZE}\n",
+            "- **Hardware**: Standard Python environment\n\n",
+            "## Results Summary\n\n",
             # Summary table
-            f.write("| Algorithm | Best Case | Worst Case | Average |\n")
-            f.write("|-----------|-----------|------------|---------|\n")
+            "| Algorithm | Best Case | Worst Case | Average |\n",
+            "|-----------|-----------|------------|---------|\n",
+        ]
+        
+        type_results = [type_data for size_data in self.results.values()
+                        for type_data in size_data.values() if type_data]
+        
+        for algo_name in self.algorithm_names:
+            all_times = [type_data[algo_name]['mean_time'] for type_data in type_results
+                         if type_data.get(algo_name)]
             
-            for algo_name in self.sorters.keys():
-                all_times = []
-                for size_data in self.results.values():
-                    for type_data in size_data.values():
-                        if type_data and type_data.get(algo_name):
-                            all_times.append(type_data[algo_name]['mean_time'])
+            if all_times:
+                stats = timing_stats(all_times)
+                lines.append(f"| {algo_name} | {stats['min_time']:.4f}s | "
+                             f"{stats['max_time']:.4f}s | {stats['mean_time']:.4f}s |\n")
+        
+        lines.append("\n## Detailed Results\n\n")
+        
+        for size in sorted_sizes:
+            lines.append(f"### Size: {size}\n\n")
+            for data_type, type_data in self.results[size].items():
+                lines.append(f"#### Data Type: {data_type}\n\n")
+                lines.append("| Algorithm | Mean Time | Std Dev | Min Time | Max Time |\n")
+                lines.append("|-----------|-----------|---------|----------|----------|\n")
                 
-                if all_times:
-                    best = min(all_times)
-                    worst = max(all_times)
-                    avg = statistics.mean(all_times)
-                    f.write(f"| {algo_name} | {best:.4f}s | {worst:.4f}s | {avg:.4f}s |\n")
-            
-            f.write("\n## Detailed Results\n\n")
-            
-            for size in sorted(self.results.keys()):
-                f.write(f"### Size: {size}\n\n")
-                for data_type in self.results[size].keys():
-                    f.write(f"#### Data Type: {data_type}\n\n")
-                    f.write("| Algorithm | Mean Time | Std Dev | Min Time | Max Time |\n")
-                    f.write("|-----------|-----------|---------|----------|----------|\n")
-                    
-                    for algo_name, result in self.results[size][data_type].items():
-                        if result:
-                            f.write(f"| {algo_name} | {result['mean_time']:.4f}s | "
-                                   f"{result['std_time']:.4f}s | {result['min_time']:.4f}s | "
-                                   f"{result['max_time']:.4f}s |\n")
-                    f.write("\n")
+                for algo_name, result in type_data.items():
+                    if result:
+                        lines.append(f"| {algo_name} | {result['mean_time']:.4f}s | "
+                                     f"{result['std_time']:.4f}s | {result['min_time']:.4f}s | "
+                                     f"{result['max_time']:.4f}s |\n")
+                lines.append("\n")
+        
+        with open(report_path, 'w') as f:
+            f.write(''.join(lines))
+
+
+# Benchmark instance owned by each worker process
+_worker_benchmark = None
+
+
+def _available_cpus() -> List[int]:
+    """Return the CPU ids this process may run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_worker(cpu_ids) -> None:
+    """Pin the worker process to a single CPU and build its benchmark."""
+    global _worker_benchmark
+    
+    if hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {cpu_ids.get_nowait()})
+        except (queue.Empty, OSError):
+            pass  # More workers than CPUs; leave scheduling to the OS
+    
+    _worker_benchmark = PerformanceBenchmark()
+
+
+def _run_cell(size: int, data_type: str, test_data: List[int]):
+    """Benchmark one (size, data_type) cell inside a worker process."""
+    cell, errors = _worker_benchmark._bench_cell(test_data)
+    return size, data_type, cell, errors
+
+
+def _print_cell(cell: Dict[str, Any], errors: Dict[str, str]) -> None:
+    """Print the mean time (or failure) of each algorithm in a cell."""
+    for algo_name, result in cell.items():
+        if result is None:
+            print(f"  {algo_name}: Failed - {errors[algo_name]}")
+        else:
+            print(f"  {algo_name}: {result['mean_time']:.4f}s")
 
 
 def main():
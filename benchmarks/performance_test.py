@@ -4,6 +4,7 @@ Performance benchmarking for Quicksort implementation.
 
 import time
 import random
+import tracemalloc
 import matplotlib.pyplot as plt
 import numpy as np
 from typing import List, Tuple
@@ -13,8 +14,8 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from quicksort import quicksort, quicksort_optimized
-from utils import generate_random_array, generate_sorted_array, generate_reverse_sorted_array
+from quicksort import quicksort_python, quicksort_optimized
+from utils import generate_random_array, generate_sorted_array
 
 
 def measure_sorting_time(sort_func, arr: List[int]) -> float:
@@ -38,7 +39,7 @@ def benchmark_sorting_algorithms():
     """Benchmark different sorting algorithms against each other."""
     sizes = [100, 500, 1000, 2000, 5000, 10000]
     algorithms = {
-        'Quicksort': quicksort,
+        'Quicksort': quicksort_python,
         'Quicksort Optimized': quicksort_optimized,
         'Python Built-in': sorted
     }
@@ -51,23 +52,15 @@ def benchmark_sorting_algorithms():
     print("-" * 60)
     
     for size in sizes:
-        times = {}
-        
         # Test with random arrays
         arr = generate_random_array(size, -1000, 1000)
         
         for name, algorithm in algorithms.items():
-            if name == 'Python Built-in':
-                test_arr = arr.copy()
-                time_taken = measure_sorting_time(algorithm, test_arr)
-            else:
-                time_taken = measure_sorting_time(algorithm, arr)
-            
-            times[name] = time_taken
-            results[name].append(time_taken)
+            test_arr = arr.copy() if name == 'Python Built-in' else arr
+            results[name].append(measure_sorting_time(algorithm, test_arr))
         
-        print(f"{size:<10} {times['Quicksort']:<15.6f} "
-              f"{times['Quicksort Optimized']:<15.6f} {times['Python Built-in']:<15.6f}")
+        print(f"{size:<10} {results['Quicksort'][-1]:<15.6f} "
+              f"{results['Quicksort Optimized'][-1]:<15.6f} {results['Python Built-in'][-1]:<15.6f}")
     
     return sizes, results
 
@@ -82,17 +75,15 @@ def benchmark_worst_case():
     print("-" * 50)
     
     for size in sizes:
-        # Random array
-        random_arr = generate_random_array(size, -1000, 1000)
-        random_time = measure_sorting_time(quicksort, random_arr)
-        
-        # Already sorted array
+        # The functional quicksort returns a new list, so the inputs can be
+        # shared; the reverse-sorted array is derived from the sorted one
         sorted_arr = generate_sorted_array(size)
-        sorted_time = measure_sorting_time(quicksort, sorted_arr)
+        reverse_arr = sorted_arr[::-1]
+        random_arr = generate_random_array(size, -1000, 1000)
         
-        # Reverse sorted array
-        reverse_arr = generate_reverse_sorted_array(size)
-        reverse_time = measure_sorting_time(quicksort, reverse_arr)
+        random_time = measure_sorting_time(quicksort_python, random_arr)
+        sorted_time = measure_sorting_time(quicksort_python, sorted_arr)
+        reverse_time = measure_sorting_time(quicksort_python, reverse_arr)
         
         print(f"{size:<10} {random_time:<15.6f} {sorted_time:<15.6f} {reverse_time:<15.6f}")
 
@@ -161,30 +152,35 @@ def plot_performance_results(sizes: List[int], results: dict):
 
 
 def memory_usage_analysis():
-    """Analyze memory usage patterns."""
+    """
+    Analyze memory usage patterns.
+    
+    Reports the peak memory allocated by the pure-Python quicksort for
+    each size, measured with tracemalloc at the Python allocator level
+    rather than from process RSS, so the numbers are deterministic and
+    unaffected by unrelated memory activity.
+    """
     sizes = [100, 1000, 5000, 10000]
     
     print("\nMemory Usage Analysis...")
     print("-" * 40)
-    print(f"{'Size':<10} {'Memory (MB)':<15}")
+    print(f"{'Size':<10} {'Peak Memory (MB)':<15}")
     print("-" * 40)
     
-    for size in sizes:
-        arr = generate_random_array(size)
-        
-        # Measure memory before sorting
-        import psutil
-        import os
-        
-        process = psutil.Process(os.getpid())
-        memory_before = process.memory_info().rss / 1024 / 1024
-        
-        # Sort the array
-        quicksort(arr)
-        
-        memory_after = process.memory_info().rss / 1024 / 1024
-        
-        print(f"{size:<10} {memory_after - memory_before:<15.2f}")
+    tracemalloc.start()
+    try:
+        for size in sizes:
+            arr = generate_random_array(size)
+            
+            # Only count allocations made by the sort itself
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            quicksort_python(arr)
+            _, peak = tracemalloc.get_traced_memory()
+            
+            print(f"{size:<10} {(peak - baseline) / 1024 / 1024:<15.2f}")
+    finally:
+        tracemalloc.stop()
 
 
 def run_comprehensive_benchmark():
@@ -200,10 +196,7 @@ def run_comprehensive_benchmark():
     benchmark_worst_case()
     
     # Memory analysis
-    try:
-        memory_usage_analysis()
-    except ImportError:
-        print("\nMemory analysis skipped (psutil not available)")
+    memory_usage_analysis()
     
     # Generate plots
     try:
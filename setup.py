@@ -4,6 +4,13 @@ Setup configuration for Quicksort Algorithm Implementation.
 
 from setuptools import setup, find_packages
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["src/quicksort_cy.pyx"], language_level=3)
+except ImportError:
+    # The compiled quicksort is optional; skip it without Cython
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -17,6 +24,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/quicksort-project",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -40,9 +48,17 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
+            "pytest-benchmark>=4.0.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
         ],
+        "numba": [
+            "numba>=0.57.0",
+        ],
+        "cython": [
+            "cython>=3.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -12,19 +12,96 @@ Author: Advanced Algorithm Implementation
 Version: 2.0.0
 """
 
-import math
+import operator
+import os
 import random
-import statistics
-from typing import List, Callable, Any, Tuple, Optional
+from typing import List, Callable, Any, Optional
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+from utils import as_numeric_array, decorate_by_key
+from quicksort import _insertion_sort
+from qs_numba import NUMBA_AVAILABLE, quicksort_numba
+
+try:
+    from quicksort_cy import quicksort_array
+except ImportError:
+    quicksort_array = None
+
 logger = logging.getLogger(__name__)
 
+# Local binding for pivot selection, as in quicksort.py
+_randint = random.randint
+
+# Three-way partition loop specialized by _get_partition3
+_PARTITION3_TEMPLATE = """
+def partition3(arr, low, high, key):
+{select}    pivot = {pivot}
+    lt, i, gt = low, low, high
+    while i <= gt:
+        value = {value}
+        if value {before} pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif value {after} pivot:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+"""
+
+# Median-of-three pivot selection inlined into _PARTITION3_TEMPLATE; same
+# steps as AdvancedQuicksort._median_of_three, then the pivot moves to high
+_MEDIAN_OF_THREE_SOURCE = """\
+    mid = (low + high) // 2
+    if arr[mid] < arr[low]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+    if arr[high] < arr[mid]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+    arr[mid], arr[high] = arr[high], arr[mid]
+"""
+
+# Generated partition loops keyed by (key is None, reverse, median_of_three).
+# Shared by all instances; a concurrent first use may exec a variant twice,
+# which is harmless since both results are identical
+_PARTITION3_VARIANTS = {}
+
+
+def _get_partition3(key: Callable, reverse: bool, median_of_three: bool = False) -> Callable:
+    """
+    Return the three-way partition loop compiled for one key/order combination.
+    
+    Each variant is generated from ``_PARTITION3_TEMPLATE`` with the key
+    call and comparison operators written out, so the inner loop does not
+    test ``key`` or ``reverse`` per element. With ``median_of_three`` the
+    variant also selects its pivot; otherwise it partitions around
+    ``arr[high]``. The returned ``partition3(arr, low, high, key)`` gives
+    ``(lt, gt)`` such that ``arr[lt:gt+1]`` holds the elements equal to the
+    pivot, with the elements ordered before it to the left and those ordered
+    after it to the right.
+    """
+    variant = (key is None, reverse, median_of_three)
+    partition = _PARTITION3_VARIANTS.get(variant)
+    if partition is None:
+        source = _PARTITION3_TEMPLATE.format(
+            select=_MEDIAN_OF_THREE_SOURCE if median_of_three else '',
+            pivot='arr[high]' if key is None else 'key(arr[high])',
+            value='arr[i]' if key is None else 'key(arr[i])',
+            before='>' if reverse else '<',
+            after='<' if reverse else '>',
+        )
+        namespace = {}
+        exec(source, namespace)
+        partition = _PARTITION3_VARIANTS[variant] = namespace['partition3']
+    return partition
+
 
 class AdvancedQuicksort:
     """
@@ -35,24 +112,54 @@ class AdvancedQuicksort:
     - Median-of-medians pivot selection
     - Introsort (hybrid of quicksort, heapsort, and insertion sort)
     - Parallel processing support
+    - Delegation of plain numeric input to a vectorized backend
     """
     
-    def __init__(self, threshold: int = 10, max_depth: int = None):
+    BACKENDS = ('auto', 'numpy', 'numba', 'cython', 'python')
+    
+    # Worker pool shared by all instances, created on first parallel sort;
+    # reset in forked children (see register_at_fork below the class)
+    _pool: Optional[ThreadPoolExecutor] = None
+    _pool_workers = os.cpu_count() or 1
+    _pool_lock = threading.Lock()
+    
+    def __init__(self, threshold: int = 10, max_depth: int = None, backend: str = 'auto'):
         """
         Initialize AdvancedQuicksort with optimization parameters.
         
         Args:
             threshold: Size threshold for switching to insertion sort
             max_depth: Maximum recursion depth before switching to heapsort
+            backend: How numeric input without key/reverse is sorted:
+                'auto' or 'numpy' delegate to NumPy's vectorized quicksort,
+                'numba' uses the compiled kernel from ``qs_numba``,
+                'cython' uses the typed kernel from ``quicksort_cy`` for
+                contiguous int64/float64 data (other arrays fall back to NumPy),
+                'python' always uses the pure-Python implementation
+        
+        Raises:
+            ValueError: If ``backend`` is unknown
+            ImportError: If ``backend`` is 'numba' and Numba is not installed,
+                or 'cython' and the ``quicksort_cy`` extension is not built
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        if backend == 'numba' and not NUMBA_AVAILABLE:
+            raise ImportError("backend='numba' requires numba (pip install numba)")
+        if backend == 'cython' and quicksort_array is None:
+            raise ImportError("backend='cython' requires the quicksort_cy extension "
+                              "(build with: cythonize -i src/quicksort_cy.pyx)")
+        
         self.threshold = threshold
-        self.max_depth = max_depth or 2 * math.floor(math.log2(1000))  # Default based on array size
+        self.max_depth = max_depth or 2 * ((1000).bit_length() - 1)  # Default based on array size
+        self.backend = backend
         
     def sort(self, arr: List[Any], 
              pivot_strategy: str = 'median_of_three',
              parallel: bool = False,
              key: Callable[[Any], Any] = None,
-             reverse: bool = False) -> List[Any]:
+             reverse: bool = False,
+             inplace: bool = False) -> List[Any]:
         """
         Main sorting method with configurable strategies.
         
@@ -62,48 +169,114 @@ class AdvancedQuicksort:
             parallel: Enable parallel processing for large arrays
             key: Key function for custom sorting
             reverse: Sort in descending order
+            inplace: Sort ``arr`` itself instead of a copy (mutates the input)
             
         Returns:
-            Sorted list
+            Sorted list (a sorted ndarray if ``arr`` is a NumPy array); ``arr``
+            itself when ``inplace`` is True
+        
+        Sorts with ``key`` are stable: the key is computed once per element
+        and ties are broken on the original position.
+        
+        Lists of only ints or only floats sorted without ``key``/``reverse``
+        are delegated to NumPy (or the compiled kernel selected by ``backend``)
+        unless the backend is 'python'; the pivot strategy then has no effect.
         """
-        if not arr:
+        if len(arr) == 0:
             return arr
-            
+        
+        if key is not None:
+            decorated = decorate_by_key(arr, key, reverse)
+            self.sort(decorated, pivot_strategy, parallel, reverse=reverse, inplace=True)
+            work = arr if inplace else arr.copy()
+            work[:] = [item[2] for item in decorated]
+            return work
+        
+        if (key is None and not reverse and pivot_strategy != 'introsort'
+                and self.backend != 'python'):
+            numeric = as_numeric_array(arr)
+            if numeric is not None:
+                # Lists are already converted to a new array; copy only an
+                # ndarray input that must be left unchanged
+                work = numeric.copy() if numeric is arr and not inplace else numeric
+                self._sort_array(work)
+                
+                if isinstance(arr, np.ndarray):
+                    return work
+                if inplace:
+                    arr[:] = work.tolist()
+                    return arr
+                return work.tolist()
+        
         if pivot_strategy == 'introsort':
-            return self.introsort(arr[:], key=key, reverse=reverse)
+            return self.introsort(arr, key=key, reverse=reverse, inplace=inplace)
         elif parallel and len(arr) > 10000:
-            return self.parallel_quicksort(arr[:], key=key, reverse=reverse)
+            return self.parallel_quicksort(arr, key=key, reverse=reverse, inplace=inplace)
         else:
-            return self._quicksort_recursive(arr[:], 0, len(arr) - 1, 
+            work = arr if inplace else arr.copy()
+            return self._quicksort_recursive(work, 0, len(work) - 1, 
                                            pivot_strategy, key, reverse)
     
+    def _sort_array(self, arr: np.ndarray) -> None:
+        """Sort a 1-D numeric array in-place with the configured compiled backend."""
+        if self.backend == 'numba':
+            quicksort_numba(arr, max(self.threshold, 1))
+        elif (self.backend == 'cython' and arr.dtype in (np.int64, np.float64)
+              and arr.flags.c_contiguous):
+            quicksort_array(arr, max(self.threshold, 1))
+        else:
+            arr.sort(kind='quicksort')
+    
     def _quicksort_recursive(self, arr: List[Any], low: int, high: int,
                            pivot_strategy: str, key: Callable, reverse: bool) -> List[Any]:
-        """Internal recursive quicksort implementation."""
-        if low < high:
-            # Use insertion sort for small arrays
-            if high - low < self.threshold:
-                self._insertion_sort_range(arr, low, high, key, reverse)
-                return arr
+        """
+        Internal quicksort implementation for the range [low, high].
+        
+        Rather than recursing into both sides, the larger side of each
+        partition is pushed on an explicit stack and the loop continues with
+        the smaller one, so at most O(log n) ranges are pending.
+        """
+        threshold = self.threshold
+        # The median-of-three variant picks its own pivot; ranges only shrink,
+        # so one below the threshold never needs a partition loop
+        select_pivot = pivot_strategy != 'median_of_three'
+        partition3 = None
+        if high - low >= threshold:
+            partition3 = _get_partition3(key, reverse, not select_pivot)
+        stack = []
+        push, pop = stack.append, stack.pop
+        
+        while True:
+            while low < high and high - low >= threshold:
+                # Select pivot based on strategy
+                if select_pivot:
+                    pivot_index = self._select_pivot(arr, low, high, pivot_strategy)
+                    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
                 
-            # Select pivot based on strategy
-            pivot_index = self._select_pivot(arr, low, high, pivot_strategy)
-            arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
-            
-            # Partition
-            p = self._partition(arr, low, high, key, reverse)
+                # Three-way partition: elements equal to the pivot are final
+                lt, gt = partition3(arr, low, high, key)
+                
+                # Defer the larger side, continue with the smaller one
+                if lt - low < high - gt:
+                    push((gt + 1, high))
+                    high = lt - 1
+                else:
+                    push((low, lt - 1))
+                    low = gt + 1
             
-            # Recursively sort sub-arrays
-            self._quicksort_recursive(arr, low, p - 1, pivot_strategy, key, reverse)
-            self._quicksort_recursive(arr, p + 1, high, pivot_strategy, key, reverse)
+            # Use insertion sort for small arrays
+            if low < high:
+                self._insertion_sort_range(arr, low, high, key, reverse)
             
-        return arr
+            if not stack:
+                return arr
+            low, high = pop()
     
     def _select_pivot(self, arr: List[Any], low: int, high: int, 
                      strategy: str) -> int:
         """Select pivot based on specified strategy."""
         if strategy == 'random':
-            return random.randint(low, high)
+            return _randint(low, high)
         elif strategy == 'median_of_three':
             return self._median_of_three(arr, low, high)
         elif strategy == 'median_of_medians':
@@ -112,214 +285,293 @@ class AdvancedQuicksort:
             return high  # Default to last element
     
     def _median_of_three(self, arr: List[Any], low: int, high: int) -> int:
-        """Select median of first, middle, and last elements as pivot."""
+        """
+        Select median of first, middle, and last elements as pivot.
+        
+        The three elements are ordered in place with at most three
+        compare-and-swap steps, which leaves their median at the middle index.
+        """
         mid = (low + high) // 2
         
-        # Compare three elements
-        a, b, c = arr[low], arr[mid], arr[high]
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+        if arr[high] < arr[mid]:
+            arr[mid], arr[high] = arr[high], arr[mid]
+            if arr[mid] < arr[low]:
+                arr[low], arr[mid] = arr[mid], arr[low]
         
-        if a <= b <= c or c <= b <= a:
-            return mid
-        elif b <= a <= c or c <= a <= b:
-            return low
-        else:
-            return high
+        return mid
     
     def _median_of_medians(self, arr: List[Any], low: int, high: int) -> int:
         """Select pivot using median-of-medians algorithm (linear time selection)."""
+        # Sort indices rather than values so the pivot index is known
+        # without searching the array for the chosen value
+        value_at = arr.__getitem__
         if high - low < 5:
-            # Use insertion sort for small arrays
-            temp = arr[low:high+1]
-            temp.sort(key=lambda x: x)
-            median_val = temp[len(temp)//2]
-            return arr.index(median_val, low, high+1)
+            group = sorted(range(low, high + 1), key=value_at)
+            return group[len(group) // 2]
         
-        # Divide into groups of 5
+        # Divide into groups of 5, keeping the index of each group's median
         medians = []
-        for i in range(low, high+1, 5):
-            group_end = min(i+5, high+1)
-            group = arr[i:group_end]
-            group.sort(key=lambda x: x)
-            median_idx = i + len(group)//2
-            medians.append(arr[median_idx])
-        
-        # Find median of medians
-        median_of_medians = statistics.median(medians)
-        
-        # Find index of median_of_medians in original array
-        for i in range(low, high+1):
-            if arr[i] == median_of_medians:
-                return i
-        
-        return (low + high) // 2
+        for i in range(low, high + 1, 5):
+            group = sorted(range(i, min(i + 5, high + 1)), key=value_at)
+            medians.append(group[len(group) // 2])
+        
+        # Find median of medians (the lower one for an even count)
+        medians.sort(key=value_at)
+        return medians[(len(medians) - 1) // 2]
     
     def _partition(self, arr: List[Any], low: int, high: int, 
                    key: Callable, reverse: bool) -> int:
         """Partition array around pivot."""
         pivot = arr[high]
-        i = low - 1
-        
-        for j in range(low, high):
-            comparison = self._compare_elements(arr[j], pivot, key)
-            if not reverse and comparison <= 0:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-            elif reverse and comparison >= 0:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-        
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
-    
-    def _compare_elements(self, a: Any, b: Any, key: Callable = None) -> int:
-        """Compare two elements with optional key function."""
-        if key is not None:
-            a_key, b_key = key(a), key(b)
+        i = low
+        
+        # One loop per key/order combination so the comparison is a single
+        # operator instead of a method call per element
+        if key is None:
+            if not reverse:
+                for j in range(low, high):
+                    if arr[j] <= pivot:
+                        arr[i], arr[j] = arr[j], arr[i]
+                        i += 1
+            else:
+                for j in range(low, high):
+                    if arr[j] >= pivot:
+                        arr[i], arr[j] = arr[j], arr[i]
+                        i += 1
         else:
-            a_key, b_key = a, b
-            
-        if a_key < b_key:
-            return -1
-        elif a_key > b_key:
-            return 1
-        return 0
+            pivot_key = key(pivot)
+            if not reverse:
+                for j in range(low, high):
+                    if key(arr[j]) <= pivot_key:
+                        arr[i], arr[j] = arr[j], arr[i]
+                        i += 1
+            else:
+                for j in range(low, high):
+                    if key(arr[j]) >= pivot_key:
+                        arr[i], arr[j] = arr[j], arr[i]
+                        i += 1
+        
+        arr[i], arr[high] = arr[high], arr[i]
+        return i
     
     def _insertion_sort_range(self, arr: List[Any], low: int, high: int,
                             key: Callable, reverse: bool) -> None:
         """Insertion sort for small ranges."""
+        if not reverse:
+            # Binary insertion shared with the basic implementation
+            _insertion_sort(arr, low, high, key)
+            return
+        
         for i in range(low + 1, high + 1):
-            key_val = arr[i]
+            value = arr[i]
             j = i - 1
-            while j >= low:
-                comparison = self._compare_elements(arr[j], key_val, key)
-                if not reverse and comparison > 0:
+            if key is None:
+                while j >= low and arr[j] < value:
                     arr[j + 1] = arr[j]
                     j -= 1
-                elif reverse and comparison < 0:
+            else:
+                value_key = key(value)
+                while j >= low and key(arr[j]) < value_key:
                     arr[j + 1] = arr[j]
                     j -= 1
-                else:
-                    break
-            arr[j + 1] = key_val
+            arr[j + 1] = value
     
-    def introsort(self, arr: List[Any], key: Callable = None, reverse: bool = False) -> List[Any]:
+    def introsort(self, arr: List[Any], key: Callable = None, reverse: bool = False,
+                  inplace: bool = False) -> List[Any]:
         """
         Introsort implementation - hybrid of quicksort, heapsort, and insertion sort.
         
         Introsort starts with quicksort and switches to heapsort when the recursion
         depth exceeds a threshold, ensuring O(n log n) worst-case performance while
         maintaining quicksort's average-case efficiency.
+        
+        With ``inplace=True`` the input is sorted and returned instead of a copy.
         """
         def _introsort_helper(arr: List[Any], low: int, high: int, depth_limit: int) -> None:
-            while high - low > self.threshold:
-                if depth_limit == 0:
-                    # Switch to heapsort
-                    self._heapsort_range(arr, low, high, key, reverse)
-                    return
-                
-                # Use quicksort
-                pivot_index = self._median_of_three(arr, low, high)
-                arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
-                
-                p = self._partition(arr, low, high, key, reverse)
-                
-                # Recurse on smaller partition first (tail recursion optimization)
-                if p - low < high - p:
-                    _introsort_helper(arr, low, p - 1, depth_limit - 1)
-                    low = p + 1
-                else:
-                    _introsort_helper(arr, p + 1, high, depth_limit - 1)
-                    high = p - 1
+            stack = []
+            push, pop = stack.append, stack.pop
             
-            # Use insertion sort for small arrays
-            self._insertion_sort_range(arr, low, high, key, reverse)
+            while True:
+                while high - low > self.threshold:
+                    if depth_limit == 0:
+                        # Switch to heapsort
+                        self._heapsort_range(arr, low, high, key, reverse)
+                        break
+                    depth_limit -= 1
+                    
+                    # Use quicksort
+                    pivot_index = self._median_of_three(arr, low, high)
+                    arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+                    
+                    p = self._partition(arr, low, high, key, reverse)
+                    
+                    # Defer the larger partition, continue with the smaller one
+                    if p - low < high - p:
+                        push((p + 1, high, depth_limit))
+                        high = p - 1
+                    else:
+                        push((low, p - 1, depth_limit))
+                        low = p + 1
+                else:
+                    # Use insertion sort for small arrays
+                    self._insertion_sort_range(arr, low, high, key, reverse)
+                
+                if not stack:
+                    return
+                low, high, depth_limit = pop()
         
-        result = arr[:]
-        max_depth = 2 * math.floor(math.log2(len(result))) if result else 0
+        result = arr if inplace else arr.copy()
+        max_depth = 2 * (len(result).bit_length() - 1) if len(result) else 0
         _introsort_helper(result, 0, len(result) - 1, max_depth)
         return result
     
     def _heapsort_range(self, arr: List[Any], low: int, high: int,
                        key: Callable = None, reverse: bool = False) -> None:
         """Heapsort implementation for range [low, high]."""
-        def heapify(arr: List[Any], n: int, i: int) -> None:
-            largest = i
-            left = 2 * i + 1
-            right = 2 * i + 2
-            
-            if left < n and self._compare_elements(arr[left], arr[largest], key) > 0:
-                largest = left
+        # Max-heap for ascending order, min-heap for descending order
+        if key is None:
+            above = operator.lt if reverse else operator.gt
+        elif reverse:
+            def above(a: Any, b: Any) -> bool:
+                return key(a) < key(b)
+        else:
+            def above(a: Any, b: Any) -> bool:
+                return key(a) > key(b)
+        
+        def heapify(arr: List[Any], n: int, i: int, base: int) -> None:
+            # Sift arr[base + i] down the heap stored in arr[base:base + n]
+            while True:
+                largest = i
+                left = 2 * i + 1
+                right = left + 1
+                
+                if left < n and above(arr[base + left], arr[base + largest]):
+                    largest = left
                 
-            if right < n and self._compare_elements(arr[right], arr[largest], key) > 0:
-                largest = right
+                if right < n and above(arr[base + right], arr[base + largest]):
+                    largest = right
                 
-            if largest != i:
-                arr[i], arr[largest] = arr[largest], arr[i]
-                heapify(arr, n, largest)
+                if largest == i:
+                    return
+                arr[base + i], arr[base + largest] = arr[base + largest], arr[base + i]
+                i = largest
         
         n = high - low + 1
         
-        # Build max heap
+        # Build heap
         for i in range(n // 2 - 1, -1, -1):
-            heapify(arr[low:high+1], n, i)
+            heapify(arr, n, i, low)
         
         # Extract elements one by one
         for i in range(n - 1, 0, -1):
             arr[low], arr[low + i] = arr[low + i], arr[low]
-            heapify(arr[low:high+1], i, 0)
+            heapify(arr, i, 0, low)
+    
+    @classmethod
+    def _get_pool(cls) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ThreadPoolExecutor(max_workers=cls._pool_workers)
+            return cls._pool
+    
+    @classmethod
+    def _reset_pool(cls) -> None:
+        """Forget the shared pool in a forked child, where its threads do not exist."""
+        cls._pool = None
+        cls._pool_lock = threading.Lock()
     
     def parallel_quicksort(self, arr: List[Any], key: Callable = None,
-                          reverse: bool = False, min_parallel_size: int = 10000) -> List[Any]:
+                          reverse: bool = False, min_parallel_size: int = 10000,
+                          inplace: bool = False) -> List[Any]:
         """
-        Parallel quicksort implementation using ThreadPoolExecutor.
+        Parallel quicksort implementation using a shared ThreadPoolExecutor.
+        
+        The calling thread partitions the top levels and hands the resulting
+        ranges to the pool. Plain numeric input (unless the backend is
+        'python') is partitioned with ``np.ndarray.partition`` and its ranges
+        are sorted by NumPy or the Numba/Cython kernel, all of which release
+        the GIL; other input is sorted by pure-Python quicksort in the workers.
         
         Args:
             arr: List to sort
             key: Key function for custom sorting
             reverse: Sort in descending order
             min_parallel_size: Minimum array size to use parallel processing
+            inplace: Sort ``arr`` itself instead of a copy (mutates the input)
             
         Returns:
-            Sorted list
+            Sorted list (a sorted ndarray if ``arr`` is a NumPy array); ``arr``
+            itself when ``inplace`` is True
         """
-        def _parallel_sort(arr: List[Any], low: int, high: int, depth: int) -> None:
-            if low >= high:
-                return
+        pool = self._get_pool()
+        # Enough levels for about two ranges per worker
+        max_depth = (2 * self._pool_workers - 1).bit_length()
+        futures = []
+        
+        numeric = None
+        if key is None and not reverse and self.backend != 'python':
+            numeric = as_numeric_array(arr)
+        
+        if numeric is not None:
+            result = numeric.copy() if numeric is arr and not inplace else numeric
+            stack = [(result, max_depth)]
+            while stack:
+                view, depth = stack.pop()
+                if len(view) < min_parallel_size or depth <= 0:
+                    futures.append(pool.submit(self._sort_array, view))
+                    continue
                 
-            # Use sequential sort for small arrays
+                # Put the median in place with smaller values before it
+                mid = len(view) // 2
+                view.partition(mid)
+                stack.append((view[:mid], depth - 1))
+                stack.append((view[mid + 1:], depth - 1))
+            
+            for future in wait(futures).done:
+                future.result()
+            
+            if isinstance(arr, np.ndarray):
+                return result
+            if inplace:
+                arr[:] = result.tolist()
+                return arr
+            return result.tolist()
+        
+        result = arr if inplace else arr.copy()
+        stack = [(0, len(result) - 1, max_depth)]
+        while stack:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+            
+            # Hand small ranges to the pool
             if high - low < min_parallel_size or depth <= 0:
-                self._quicksort_recursive(arr, low, high, 'median_of_three', key, reverse)
-                return
+                futures.append(pool.submit(self._quicksort_recursive, result, low, high,
+                                           'median_of_three', key, reverse))
+                continue
             
             # Partition
-            pivot_index = self._median_of_three(arr, low, high)
-            arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
-            p = self._partition(arr, low, high, key, reverse)
+            pivot_index = self._median_of_three(result, low, high)
+            result[pivot_index], result[high] = result[high], result[pivot_index]
+            p = self._partition(result, low, high, key, reverse)
             
-            # Parallel processing for sub-arrays
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = []
-                
-                if p - low > min_parallel_size // 2:
-                    futures.append(executor.submit(_parallel_sort, arr, low, p - 1, depth - 1))
-                else:
-                    _parallel_sort(arr, low, p - 1, depth - 1)
-                
-                if high - p > min_parallel_size // 2:
-                    futures.append(executor.submit(_parallel_sort, arr, p + 1, high, depth - 1))
-                else:
-                    _parallel_sort(arr, p + 1, high, depth - 1)
-                
-                # Wait for parallel tasks to complete
-                for future in as_completed(futures):
-                    future.result()
+            stack.append((low, p - 1, depth - 1))
+            stack.append((p + 1, high, depth - 1))
         
-        result = arr[:]
-        max_depth = math.floor(math.log2(len(result))) if result else 0
-        _parallel_sort(result, 0, len(result) - 1, max_depth)
+        # Wait for all ranges and re-raise any worker exception
+        for future in wait(futures).done:
+            future.result()
         return result
 
 
+# A forked child inherits _pool but not its worker threads
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=AdvancedQuicksort._reset_pool)
+
+
 class QuicksortVisualizer:
     """
     Visualization utilities for the quicksort algorithm.
@@ -384,6 +636,8 @@ def quicksort_parallel(arr: List[Any], **kwargs) -> List[Any]:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Example usage and testing
     test_arrays = [
         [64, 34, 25, 12, 22, 11, 90],
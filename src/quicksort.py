@@ -19,11 +19,22 @@ Time Complexity:
 - Space Complexity: O(log n) - due to recursive call stack
 
 The implementation includes both functional (returns new list) and in-place versions.
+Plain numeric input (all ints or all floats, no key, ascending) is delegated to
+NumPy's quicksort, which is vectorized with AVX-512/AVX2 on recent NumPy builds.
 """
 
 from typing import List, Callable, Any
+from bisect import bisect_right
+from itertools import chain, islice
 import random
 
+import numpy as np
+
+from utils import as_numeric_array, decorate_by_key
+
+# Bound once so pivot selection skips the module attribute lookup
+_randint = random.randint
+
 
 def quicksort(arr: List[Any], key: Callable[[Any], Any] = None, reverse: bool = False) -> List[Any]:
     """
@@ -35,7 +46,8 @@ def quicksort(arr: List[Any], key: Callable[[Any], Any] = None, reverse: bool =
         reverse: If True, sort in descending order
     
     Returns:
-        New list containing sorted elements
+        New list containing sorted elements (elements with equal keys keep
+        their original order when ``key`` is given)
     
     Examples:
         >>> quicksort([3, 1, 4, 1, 5, 9, 2, 6])
@@ -47,29 +59,68 @@ def quicksort(arr: List[Any], key: Callable[[Any], Any] = None, reverse: bool =
         >>> quicksort(['apple', 'banana', 'cherry'], key=len)
         ['apple', 'banana', 'cherry']
     """
+    if key is None and not reverse:
+        numeric = as_numeric_array(arr)
+        if numeric is not None:
+            return np.sort(numeric, kind='quicksort').tolist()
+    
+    return quicksort_python(arr, key, reverse)
+
+
+def quicksort_python(arr: List[Any], key: Callable[[Any], Any] = None,
+                     reverse: bool = False) -> List[Any]:
+    """
+    Pure-Python version of :func:`quicksort` that never delegates to NumPy.
+    
+    Use this to measure the algorithm itself on numeric input, which
+    :func:`quicksort` would hand to ``np.sort``.
+    
+    Args:
+        arr: List of comparable elements to sort
+        key: Optional function to extract comparison key from each element
+        reverse: If True, sort in descending order
+    
+    Returns:
+        New list containing sorted elements
+    
+    Examples:
+        >>> quicksort_python([3, 1, 4, 1, 5, 9, 2, 6])
+        [1, 1, 2, 3, 4, 5, 6, 9]
+    """
+    if key is not None:
+        decorated = decorate_by_key(arr, key, reverse)
+        return [item[2] for item in _quicksort(decorated, reverse)]
+    
+    return _quicksort(arr, reverse)
+
+
+def _quicksort(arr: List[Any], reverse: bool) -> List[Any]:
+    """Recursive functional quicksort used by :func:`quicksort_python`."""
     if len(arr) <= 1:
         return arr[:]
     
     # Use random pivot to avoid worst-case scenarios
-    pivot_index = random.randint(0, len(arr) - 1)
+    pivot_index = _randint(0, len(arr) - 1)
     pivot = arr[pivot_index]
     
-    # Create new array without pivot element
-    remaining = arr[:pivot_index] + arr[pivot_index + 1:]
+    # Partition everything except the pivot in a single pass
+    left, right = [], []
+    to_left, to_right = left.append, right.append
+    remaining = chain(islice(arr, pivot_index), islice(arr, pivot_index + 1, None))
     
-    # Partition the array based on reverse flag
+    # For reverse=False, elements <= pivot go left, > pivot go right;
+    # for reverse=True, elements > pivot go left, <= pivot go right
+    for x in remaining:
+        if x > pivot:
+            to_right(x)
+        else:
+            to_left(x)
     if reverse:
-        # For reverse=True, elements > pivot go left, <= pivot go right
-        left = [x for x in remaining if _compare(x, pivot, key) > 0]
-        right = [x for x in remaining if _compare(x, pivot, key) <= 0]
-    else:
-        # For reverse=False, elements <= pivot go left, > pivot go right
-        left = [x for x in remaining if _compare(x, pivot, key) <= 0]
-        right = [x for x in remaining if _compare(x, pivot, key) > 0]
+        left, right = right, left
     
     # Recursively sort sub-arrays
-    sorted_left = quicksort(left, key=key, reverse=reverse)
-    sorted_right = quicksort(right, key=key, reverse=reverse)
+    sorted_left = _quicksort(left, reverse)
+    sorted_right = _quicksort(right, reverse)
     
     # Combine results
     result = sorted_left + [pivot] + sorted_right
@@ -96,6 +147,14 @@ def quicksort_inplace(arr: List[Any], low: int = 0, high: int = None,
         [1, 1, 2, 3, 4, 5, 6, 9]
     """
     if high is None:
+        if low == 0 and key is None and not reverse:
+            numeric = as_numeric_array(arr)
+            if numeric is arr:
+                arr.sort(kind='quicksort')
+                return
+            if numeric is not None:
+                arr[:] = np.sort(numeric, kind='quicksort').tolist()
+                return
         high = len(arr) - 1
     
     if low < high:
@@ -189,15 +248,15 @@ def quicksort_optimized(arr: List[Any], key: Callable[[Any], Any] = None,
         while low < high:
             # Use insertion sort for small arrays
             if high - low < 10:
-                _insertion_sort(arr, low, high)
+                _insertion_sort(arr, low, high, key)
                 break
             
             # Random pivot selection
-            pivot_index = random.randint(low, high)
+            pivot_index = _randint(low, high)
             arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
             
-            # Partition
-            p = _partition(arr, low, high, key, reverse)
+            # Partition ascending; the result is reversed at the end
+            p = _partition(arr, low, high, key)
             
             # Tail recursion optimization
             if p - low < high - p:
@@ -217,14 +276,28 @@ def quicksort_optimized(arr: List[Any], key: Callable[[Any], Any] = None,
 
 
 def _insertion_sort(arr: List[Any], low: int, high: int, key: Callable[[Any], Any] = None) -> None:
-    """Insertion sort for small sub-arrays."""
-    for i in range(low + 1, high + 1):
-        key_val = arr[i]
-        j = i - 1
-        while j >= low and _compare(arr[j], key_val, key) > 0:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key_val
+    """
+    Insertion sort for small sub-arrays.
+    
+    Each insertion point is found with a binary search and the elements
+    after it are shifted with one slice assignment.
+    """
+    if key is None:
+        for i in range(low + 1, high + 1):
+            value = arr[i]
+            pos = bisect_right(arr, value, low, i)
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = value
+    else:
+        # Search a parallel list of keys, computing each key once
+        keys = [key(arr[i]) for i in range(low, high + 1)]
+        for i in range(1, high - low + 1):
+            value, value_key = arr[low + i], keys[i]
+            pos = bisect_right(keys, value_key, 0, i)
+            keys[pos + 1:i + 1] = keys[pos:i]
+            keys[pos] = value_key
+            arr[low + pos + 1:low + i + 1] = arr[low + pos:low + i]
+            arr[low + pos] = value
 
 
 if __name__ == "__main__":
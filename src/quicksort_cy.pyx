@@ -0,0 +1,175 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython Quicksort Implementation
+===============================
+
+Compiled counterpart of ``quicksort.quicksort`` for benchmarking against
+C-level sorts such as the built-in ``sorted``. Like CPython's own list sort,
+it works on the list's item pointers directly and compares elements with
+``PyObject_RichCompareBool(..., Py_LT)``, so any mutually comparable objects
+are supported.
+
+The sort uses median-of-three pivot selection, Hoare partitioning on a copy
+of the input, recursion on the smaller side only, and insertion sort for
+small ranges.
+
+``quicksort_array`` is a typed kernel for contiguous ``int64``/``float64``
+NumPy arrays. It compares C values instead of objects, uses three-way
+partitioning so duplicates are placed once, and releases the GIL while
+sorting.
+
+Build in place with ``cythonize -i src/quicksort_cy.pyx`` (or install the
+package with Cython available).
+"""
+
+from cpython.object cimport PyObject_RichCompareBool, Py_LT
+from libc.stdint cimport int64_t
+
+ctypedef fused number:
+    int64_t
+    double
+
+# Size below which ranges are finished with insertion sort
+cdef Py_ssize_t INSERTION_THRESHOLD = 16
+
+
+cdef int _insertion_sort(list a, Py_ssize_t low, Py_ssize_t high) except -1:
+    """Insertion sort for the range [low, high]."""
+    cdef Py_ssize_t i, j
+    cdef object value
+
+    for i in range(low + 1, high + 1):
+        value = a[i]
+        j = i - 1
+        while j >= low and PyObject_RichCompareBool(value, a[j], Py_LT):
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = value
+    return 0
+
+
+cdef int _quicksort(list a, Py_ssize_t low, Py_ssize_t high) except -1:
+    """Sort the range [low, high] of ``a`` in-place."""
+    cdef Py_ssize_t i, j, mid
+    cdef object pivot
+
+    while high - low >= INSERTION_THRESHOLD:
+        # Median-of-three: order a[low] <= a[mid] <= a[high]
+        mid = low + (high - low) // 2
+        if PyObject_RichCompareBool(a[mid], a[low], Py_LT):
+            a[low], a[mid] = a[mid], a[low]
+        if PyObject_RichCompareBool(a[high], a[low], Py_LT):
+            a[low], a[high] = a[high], a[low]
+        if PyObject_RichCompareBool(a[high], a[mid], Py_LT):
+            a[mid], a[high] = a[high], a[mid]
+        pivot = a[mid]
+
+        # Hoare-style partition: [low, j] <= pivot <= [i, high]. The scans
+        # are bounded because an inconsistent __lt__ need not stop them
+        i = low
+        j = high
+        while i <= j:
+            while i < high and PyObject_RichCompareBool(a[i], pivot, Py_LT):
+                i += 1
+            while j > low and PyObject_RichCompareBool(pivot, a[j], Py_LT):
+                j -= 1
+            if i <= j:
+                a[i], a[j] = a[j], a[i]
+                i += 1
+                j -= 1
+
+        # Recurse on the smaller side, loop on the larger one
+        if j - low < high - i:
+            _quicksort(a, low, j)
+            low = i
+        else:
+            _quicksort(a, i, high)
+            high = j
+
+    _insertion_sort(a, low, high)
+    return 0
+
+
+def quicksort_cy(list arr not None):
+    """
+    Compiled Quicksort that returns a new sorted list.
+
+    Args:
+        arr: List of comparable elements to sort
+
+    Returns:
+        New list containing sorted elements
+    """
+    cdef list result = list(arr)
+    if len(result) > 1:
+        _quicksort(result, 0, len(result) - 1)
+    return result
+
+
+cdef void _sort_array(number[::1] a, Py_ssize_t low, Py_ssize_t high,
+                      Py_ssize_t threshold) noexcept nogil:
+    """Sort the range [low, high] of a typed array in-place."""
+    cdef Py_ssize_t lt, i, gt, mid
+    cdef number pivot, value
+
+    while low < high and high - low >= threshold:
+        # Median-of-three: order a[low] <= a[mid] <= a[high]
+        mid = low + (high - low) // 2
+        if a[mid] < a[low]:
+            a[low], a[mid] = a[mid], a[low]
+        if a[high] < a[mid]:
+            a[mid], a[high] = a[high], a[mid]
+            if a[mid] < a[low]:
+                a[low], a[mid] = a[mid], a[low]
+        pivot = a[mid]
+
+        # Three-way partition: [low, lt) < pivot == [lt, gt] < (gt, high]
+        lt = low
+        i = low
+        gt = high
+        while i <= gt:
+            value = a[i]
+            if value < pivot:
+                a[i] = a[lt]
+                a[lt] = value
+                lt += 1
+                i += 1
+            elif value > pivot:
+                a[i] = a[gt]
+                a[gt] = value
+                gt -= 1
+            else:
+                i += 1
+
+        # Recurse on the smaller side, loop on the larger one
+        if lt - low < high - gt:
+            _sort_array(a, low, lt - 1, threshold)
+            low = gt + 1
+        else:
+            _sort_array(a, gt + 1, high, threshold)
+            high = lt - 1
+
+    # Insertion sort for small ranges
+    for i in range(low + 1, high + 1):
+        value = a[i]
+        mid = i - 1
+        while mid >= low and a[mid] > value:
+            a[mid + 1] = a[mid]
+            mid -= 1
+        a[mid + 1] = value
+
+
+def quicksort_array(number[::1] arr, Py_ssize_t threshold=INSERTION_THRESHOLD):
+    """
+    Sort a contiguous ``int64`` or ``float64`` array in-place.
+
+    The GIL is released while sorting, so threads can sort disjoint
+    ranges of the same array concurrently.
+
+    Args:
+        arr: One-dimensional contiguous NumPy array (or slice of one)
+        threshold: Size threshold for switching to insertion sort
+    """
+    if arr.shape[0] > 1:
+        with nogil:
+            _sort_array(arr, 0, arr.shape[0] - 1, threshold)
@@ -6,8 +6,15 @@ This module provides utility functions to support the quicksort implementation,
 including validation, array generation, and performance measurement tools.
 """
 
-from typing import List, Any
-import random
+from typing import List, Dict, Any, Optional, Sequence
+
+import numpy as np
+
+# Shortest sequence for which is_sorted converts to NumPy
+IS_SORTED_NUMPY_MIN_LENGTH = 32
+
+# Generator used for the test array helpers
+_rng = np.random.default_rng()
 
 
 def is_sorted(arr: List[Any], key=None, reverse: bool = False) -> bool:
@@ -22,6 +29,9 @@ def is_sorted(arr: List[Any], key=None, reverse: bool = False) -> bool:
     Returns:
         True if the list is sorted according to the specified criteria
     
+    Long sequences of only ints or only floats checked without ``key`` are
+    compared pairwise with vectorized NumPy operations.
+    
     Examples:
         >>> is_sorted([1, 2, 3, 4, 5])
         True
@@ -33,6 +43,14 @@ def is_sorted(arr: List[Any], key=None, reverse: bool = False) -> bool:
     if len(arr) <= 1:
         return True
     
+    if key is None and len(arr) >= IS_SORTED_NUMPY_MIN_LENGTH:
+        numeric = as_numeric_array(arr)
+        if numeric is not None:
+            # Same comparisons as the loop below, so NaN never fails the check
+            if reverse:
+                return not np.any(numeric[:-1] < numeric[1:])
+            return not np.any(numeric[:-1] > numeric[1:])
+    
     for i in range(1, len(arr)):
         if key is not None:
             a, b = key(arr[i-1]), key(arr[i])
@@ -47,6 +65,68 @@ def is_sorted(arr: List[Any], key=None, reverse: bool = False) -> bool:
     return True
 
 
+def as_numeric_array(arr: Sequence[Any]) -> Optional[np.ndarray]:
+    """
+    View a sequence as a NumPy array if it holds only ints or only floats.
+    
+    This decides whether a sort can be delegated to NumPy without changing
+    the result: mixed int/float lists, bools, strings, other objects and
+    ints outside the int64 range return None so callers keep their
+    generic comparison path.
+    
+    Args:
+        arr: List (or 1-D NumPy array) to inspect
+    
+    Returns:
+        An int64/float64 array (or ``arr`` itself for numeric ndarrays),
+        or None if the elements are not homogeneous numbers
+    
+    Examples:
+        >>> as_numeric_array([3, 1, 2]).dtype
+        dtype('int64')
+        >>> as_numeric_array([1, 2.5]) is None
+        True
+    """
+    if isinstance(arr, np.ndarray):
+        return arr if arr.ndim == 1 and arr.dtype.kind in 'iuf' else None
+    
+    types = set(map(type, arr))
+    if types == {int}:
+        try:
+            return np.asarray(arr, dtype=np.int64)
+        except OverflowError:
+            return None
+    if types == {float}:
+        return np.asarray(arr, dtype=np.float64)
+    return None
+
+
+def decorate_by_key(arr: Sequence[Any], key, reverse: bool = False) -> List[tuple]:
+    """
+    Pair each element with its key for a Schwartzian-transform sort.
+    
+    Each tuple is ``(key(value), position, value)``, with the position
+    negated when ``reverse`` is set. Sorting the tuples therefore calls
+    ``key`` once per element, breaks ties on the original order (so keyed
+    sorts are stable) and never compares the values themselves. Take
+    ``item[2]`` of each sorted tuple to undecorate.
+    
+    Args:
+        arr: Sequence to decorate
+        key: Function extracting the comparison key from each element
+        reverse: If True, ties are ordered for a descending sort
+    
+    Returns:
+        List of ``(key, position, value)`` tuples
+    
+    Examples:
+        >>> decorate_by_key(['bb', 'a'], len)
+        [(2, 0, 'bb'), (1, 1, 'a')]
+    """
+    sign = -1 if reverse else 1
+    return [(key(value), sign * i, value) for i, value in enumerate(arr)]
+
+
 def generate_random_array(size: int, min_val: int = 0, max_val: int = 1000, 
                          unique: bool = False) -> List[int]:
     """
@@ -65,16 +145,17 @@ def generate_random_array(size: int, min_val: int = 0, max_val: int = 1000,
         >>> arr = generate_random_array(10)
         >>> len(arr)
         10
-        >>> all(min_val <= x <= max_val for x in arr)
+        >>> all(0 <= x <= 1000 for x in arr)
         True
     """
     if unique and size > (max_val - min_val + 1):
         raise ValueError("Cannot generate unique array: range too small for size")
     
     if unique:
-        return random.sample(range(min_val, max_val + 1), size)
+        values = _rng.choice(max_val - min_val + 1, size, replace=False) + min_val
     else:
-        return [random.randint(min_val, max_val) for _ in range(size)]
+        values = _rng.integers(min_val, max_val, size=size, endpoint=True)
+    return values.tolist()
 
 
 def generate_sorted_array(size: int, reverse: bool = False) -> List[int]:
@@ -123,7 +204,8 @@ def generate_nearly_sorted_array(size: int, swaps: int = 5) -> List[int]:
     
     Args:
         size: Number of elements in the array
-        swaps: Number of swaps to perform
+        swaps: Number of swaps to perform, each between two positions not
+            used by another swap (capped at ``size // 2``)
     
     Returns:
         Nearly sorted list of integers
@@ -133,13 +215,60 @@ def generate_nearly_sorted_array(size: int, swaps: int = 5) -> List[int]:
         >>> is_sorted(arr)
         False
     """
-    arr = generate_sorted_array(size)
+    arr = np.arange(size)
+    
+    # Draw all swap positions at once and swap the two halves
+    positions = _rng.choice(size, 2 * min(swaps, size // 2), replace=False)
+    first, second = np.split(positions, 2)
+    arr[first], arr[second] = arr[second], arr[first]
+    
+    return arr.tolist()
+
+
+def timing_stats(times: List[float]) -> Dict[str, float]:
+    """
+    Summarize timing samples in a single pass.
+    
+    Mean and standard deviation use Welford's online algorithm, so the
+    samples are traversed once for mean, variance, min and max.
+    
+    Args:
+        times: Non-empty list of timing samples
+    
+    Returns:
+        Dictionary with mean_time, median_time, std_time (sample standard
+        deviation, 0 for a single sample), min_time and max_time
+    
+    Examples:
+        >>> stats = timing_stats([3.0, 1.0, 2.0, 4.0])
+        >>> stats['mean_time'], stats['median_time'], stats['min_time'], stats['max_time']
+        (2.5, 2.5, 1.0, 4.0)
+    """
+    n = len(times)
+    mean = 0.0
+    m2 = 0.0
+    lowest = highest = times[0]
+    
+    for k, t in enumerate(times, 1):
+        if t < lowest:
+            lowest = t
+        elif t > highest:
+            highest = t
+        delta = t - mean
+        mean += delta / k
+        m2 += delta * (t - mean)
     
-    for _ in range(swaps):
-        i, j = random.sample(range(size), 2)
-        arr[i], arr[j] = arr[j], arr[i]
+    ordered = sorted(times)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
     
-    return arr
+    return {
+        'mean_time': mean,
+        'median_time': median,
+        'std_time': (m2 / (n - 1)) ** 0.5 if n > 1 else 0,
+        'min_time': lowest,
+        'max_time': highest
+    }
 
 
 def measure_memory_usage(obj: Any) -> int:
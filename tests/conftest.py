@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration: make the modules in ``src`` and the CLI
+importable.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+for path in (SRC, ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -3,49 +3,143 @@ Comprehensive test suite for Advanced Quicksort implementation.
 """
 
 import pytest
+import multiprocessing
+import os
 import random
-import time
-from typing import List, Any
 import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import tracemalloc
+import numpy as np
+from typing import List, Any
 
 from advanced_quicksort import AdvancedQuicksort, QuicksortVisualizer
 
 
+def _eq(a, b):
+    """Compare two numeric sequences element-wise with NumPy."""
+    return np.array_equal(np.asarray(a), np.asarray(b))
+
+
+class _BatchChecker:
+    """Collect (result, expected) integer pairs and compare them all at once.
+
+    Rows are padded to a common length with the int64 maximum and compared
+    with a single ``np.array_equal``. On mismatch each pair is re-checked so
+    the failure names the offending case.
+    """
+
+    _PAD = np.iinfo(np.int64).max
+
+    def __init__(self):
+        self.results = []
+        self.expected = []
+
+    def __enter__(self):
+        return self
+
+    def add(self, result, expected):
+        self.results.append(result)
+        self.expected.append(expected)
+
+    def _stack(self, rows, width):
+        out = np.full((len(rows), width), self._PAD, dtype=np.int64)
+        for i, row in enumerate(rows):
+            out[i, :len(row)] = row
+        return out
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None or not self.results:
+            return False
+        width = max(map(len, self.results + self.expected))
+        if not np.array_equal(self._stack(self.results, width), self._stack(self.expected, width)):
+            for i, (result, expected) in enumerate(zip(self.results, self.expected)):
+                assert list(result) == list(expected), f"case {i}"
+        return False
+
+
+def _parallel_sort(arr):
+    """Parallel-sort ``arr`` with small ranges; run in a child process."""
+    return AdvancedQuicksort().parallel_quicksort(arr, min_parallel_size=500)
+
+
+def _counting_sort(arr):
+    """Expected result for non-negative integers, built from value counts."""
+    counts = np.bincount(arr)
+    return np.repeat(np.arange(len(counts)), counts).tolist()
+
+
+def _with_duplicates(n, density):
+    """Shuffled list of ``n`` integers where ``density`` of them are repeats."""
+    distinct = max(1, round(n * (1 - density)))
+    values = np.resize(np.arange(distinct), n)
+    return np.random.default_rng(distinct).permutation(values).tolist()
+
+
+# Seeded generators local to this module; the global random state is untouched
+_random = random.Random(0)
+_rng = np.random.default_rng(0)
+
+# Large ordered inputs, built once
+_SORTED_1K = tuple(range(1000))
+_REVERSED_1K = tuple(range(1000, 0, -1))
+
+# Pivot strategy input and its expected result, shared by every strategy;
+# long enough that partitioning runs before the insertion sort threshold
+_PIVOT_INPUT = tuple(_rng.integers(0, 100, 200).tolist())
+_PIVOT_EXPECTED = sorted(_PIVOT_INPUT)
+
+_ARRAYS = [
+    [64, 34, 25, 12, 22, 11, 90],
+    [5, 2, 4, 6, 1, 3],
+    [1, 2, 3, 4, 5],
+    [5, 4, 3, 2, 1],
+    [3, 3, 3, 3, 3],
+    [],
+    [42],
+    _rng.integers(1, 1000, 100, endpoint=True).tolist(),
+    _rng.integers(1, 100, 1000, endpoint=True).tolist(),
+]
+
+_EDGE_CASES = [
+    [],  # Empty array
+    [1],  # Single element
+    [1, 1, 1],  # All same elements
+    [1, 2, 3, 4, 5],  # Already sorted
+    [5, 4, 3, 2, 1],  # Reverse sorted
+    [2, 1, 2, 1, 2],  # Alternating elements
+    _SORTED_1K,  # Large sorted array
+    _REVERSED_1K,  # Large reverse sorted array
+]
+
+# 10k-element input with its expected result, sorted once by NumPy
+_LARGE_10K = _rng.integers(1, 1000, 10000, endpoint=True)
+_LARGE_10K_SORTED = np.sort(_LARGE_10K)
+
+# (input, ascending, descending) triples, sorted once at import; the
+# parametrized tests sort a list() copy so no test can alter a shared input
+CASES = [(arr, sorted(arr), sorted(arr, reverse=True)) for arr in _ARRAYS]
+EDGE_CASES = [pytest.param(arr, sorted(arr), marks=[pytest.mark.slow] if len(arr) >= 1000 else [])
+              for arr in _EDGE_CASES]
+
+
 class TestAdvancedQuicksort:
     """Test cases for AdvancedQuicksort class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.sorter = AdvancedQuicksort()
-        self.test_arrays = [
-            [64, 34, 25, 12, 22, 11, 90],
-            [5, 2, 4, 6, 1, 3],
-            [1, 2, 3, 4, 5],
-            [5, 4, 3, 2, 1],
-            [3, 3, 3, 3, 3],
-            [],
-            [42],
-            [random.randint(1, 1000) for _ in range(100)],
-            [random.randint(1, 100) for _ in range(1000)],
-        ]
+    @classmethod
+    def setup_class(cls):
+        """Build the default and backend-specific sorters once for the class."""
+        cls.sorter = AdvancedQuicksort()
+        cls.backend_sorters = {backend: AdvancedQuicksort(backend=backend)
+                               for backend in ['numpy', 'python']}
     
-    def test_basic_sorting(self):
+    @pytest.mark.parametrize("arr,expected", [(a, e) for a, e, _ in CASES])
+    def test_basic_sorting(self, arr, expected):
         """Test basic sorting functionality."""
-        for arr in self.test_arrays:
-            sorted_arr = self.sorter.sort(arr)
-            expected = sorted(arr)
-            assert sorted_arr == expected
+        assert self.sorter.sort(list(arr)) == expected
     
-    def test_reverse_sorting(self):
+    @pytest.mark.parametrize("arr,expected", [(a, r) for a, _, r in CASES])
+    def test_reverse_sorting(self, arr, expected):
         """Test reverse sorting."""
-        arr = [64, 34, 25, 12, 22, 11, 90]
-        sorted_arr = self.sorter.sort(arr, reverse=True)
-        expected = sorted(arr, reverse=True)
-        assert sorted_arr == expected
+        assert self.sorter.sort(list(arr), reverse=True) == expected
     
     def test_key_function(self):
         """Test sorting with key function."""
@@ -54,94 +148,108 @@ class TestAdvancedQuicksort:
         expected = sorted(arr, key=len)
         assert sorted_arr == expected
     
-    def test_pivot_strategies(self):
+    @pytest.mark.parametrize("strategy", ["random", "median_of_three", "median_of_medians"])
+    def test_pivot_strategies(self, strategy):
         """Test different pivot selection strategies."""
-        arr = [64, 34, 25, 12, 22, 11, 90]
-        
-        strategies = ['random', 'median_of_three', 'median_of_medians']
-        for strategy in strategies:
-            sorted_arr = self.sorter.sort(arr, pivot_strategy=strategy)
-            expected = sorted(arr)
-            assert sorted_arr == expected
+        # The python backend, since NumPy ignores pivot_strategy
+        python_sorter = self.backend_sorters['python']
+        arr = list(_PIVOT_INPUT)
+        assert python_sorter.sort(arr, pivot_strategy=strategy) == _PIVOT_EXPECTED
     
-    def test_introsort(self):
+    @pytest.mark.parametrize("arr,expected", [(a, e) for a, e, _ in CASES])
+    def test_introsort(self, arr, expected):
         """Test introsort implementation."""
-        for arr in self.test_arrays:
-            sorted_arr = self.sorter.introsort(arr)
-            expected = sorted(arr)
-            assert sorted_arr == expected
+        assert self.sorter.introsort(list(arr)) == expected
+    
+    def test_introsort_numpy_input(self):
+        """Test introsort on NumPy arrays, copied and in-place."""
+        arr = np.array([5, 3, 9, 1, 7])
+        assert self.sorter.introsort(arr).tolist() == [1, 3, 5, 7, 9]
+        assert arr.tolist() == [5, 3, 9, 1, 7]
+        assert self.sorter.introsort(arr, inplace=True) is arr
+        assert arr.tolist() == [1, 3, 5, 7, 9]
+        assert self.sorter.introsort(np.array([], dtype=np.int64)).size == 0
+    
+    def test_heapsort_range(self):
+        """Test that heapsort sorts only the requested range, in either order."""
+        arr = _random.choices(range(-100, 101), k=50)
+        for key in [None, abs]:
+            for reverse in [False, True]:
+                result = arr[:]
+                self.sorter._heapsort_range(result, 10, 39, key, reverse)
+                assert result[:10] == arr[:10]
+                assert result[40:] == arr[40:]
+                keyed = [key(x) if key else x for x in result[10:40]]
+                assert keyed == sorted(keyed, reverse=reverse)
+                assert sorted(result) == sorted(arr)
     
+    @pytest.mark.slow
     def test_parallel_quicksort(self):
         """Test parallel quicksort implementation."""
-        large_arr = [random.randint(1, 1000) for _ in range(10000)]
+        large_arr = _LARGE_10K.tolist()
         
         # Test that parallel sort produces correct result
         sorted_parallel = self.sorter.parallel_quicksort(large_arr)
-        expected = sorted(large_arr)
-        assert sorted_parallel == expected
+        expected = _LARGE_10K_SORTED
+        assert _eq(sorted_parallel, expected)
+        
+        # Small ranges split across the pool, for NumPy and Python leaves
+        for backend in ['numpy', 'python']:
+            backend_sorter = self.backend_sorters[backend]
+            assert _eq(backend_sorter.parallel_quicksort(large_arr, min_parallel_size=500), expected)
+            assert _eq(backend_sorter.parallel_quicksort(large_arr, reverse=True, min_parallel_size=500),
+                       expected[::-1])
     
-    def test_edge_cases(self):
-        """Test edge cases."""
-        edge_cases = [
-            [],  # Empty array
-            [1],  # Single element
-            [1, 1, 1],  # All same elements
-            [1, 2, 3, 4, 5],  # Already sorted
-            [5, 4, 3, 2, 1],  # Reverse sorted
-            [2, 1, 2, 1, 2],  # Alternating elements
-            list(range(1000)),  # Large sorted array
-            list(range(1000, 0, -1)),  # Large reverse sorted array
-        ]
+    @pytest.mark.slow
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork()")
+    def test_parallel_quicksort_after_fork(self):
+        """Test that a forked child does not reuse the parent's worker pool."""
+        arr = _LARGE_10K.tolist()
+        self.sorter.parallel_quicksort(arr, min_parallel_size=500)
         
-        for arr in edge_cases:
-            sorted_arr = self.sorter.sort(arr)
-            expected = sorted(arr)
-            assert sorted_arr == expected
+        with multiprocessing.get_context('fork').Pool(1) as pool:
+            result = pool.apply_async(_parallel_sort, (arr,)).get(timeout=60)
+        assert _eq(result, _LARGE_10K_SORTED)
+    
+    @pytest.mark.parametrize("arr,expected", EDGE_CASES)
+    def test_edge_cases(self, arr, expected):
+        """Test edge cases."""
+        assert self.sorter.sort(list(arr)) == expected
     
     def test_stability_consistency(self):
         """Test that sorting is consistent across multiple runs."""
-        arr = [random.randint(1, 100) for _ in range(50)]
-        
-        # Run multiple times and check consistency
-        results = []
-        for _ in range(10):
-            sorted_arr = self.sorter.sort(arr)
-            results.append(sorted_arr)
+        arr = _random.choices(range(1, 101), k=50)
         
-        # All results should be identical
-        assert all(r == results[0] for r in results)
+        # Repeat the sort a few times and compare all runs at once
+        base = self.sorter.sort(arr)
+        stacked = np.array([self.sorter.sort(arr) for _ in range(3)])
+        assert (stacked == np.asarray(base)).all()
     
-    def test_performance_characteristics(self):
-        """Test performance characteristics."""
-        # Test that larger arrays take more time
-        sizes = [100, 1000, 5000]
-        times = []
-        
-        for size in sizes:
-            arr = [random.randint(1, 1000) for _ in range(size)]
-            
-            start_time = time.time()
-            self.sorter.sort(arr)
-            end_time = time.time()
-            
-            times.append(end_time - start_time)
-        
-        # Generally, larger arrays should take more time
-        # Note: This is a weak test due to randomness and system variations
-        assert times[1] >= times[0] * 0.5  # 10x size should take at least 5x time
+    @pytest.mark.slow
+    @pytest.mark.parametrize("size", [100, 1000, 5000])
+    def test_scaling(self, benchmark, size):
+        """Benchmark sorting at several sizes (compare runs with --benchmark-compare)."""
+        arr = np.random.default_rng(size).integers(1, 1000, size, endpoint=True).tolist()
+        result = benchmark.pedantic(self.sorter.sort, args=(arr,), rounds=50, iterations=5)
+        assert _eq(result, sorted(arr))
     
+    @pytest.mark.slow
     def test_memory_efficiency(self):
-        """Test memory efficiency of in-place vs functional implementations."""
-        large_arr = [random.randint(1, 1000) for _ in range(10000)]
+        """Test that sorting allocates at most a few copies of the input."""
+        large_arr = _LARGE_10K.tolist()
+        python_sorter = self.backend_sorters['python']
         
-        # Test that in-place operations don't create excessive copies
-        original_length = len(large_arr)
-        sorted_arr = self.sorter.sort(large_arr)
+        tracemalloc.start()
+        try:
+            sorted_arr = python_sorter.sort(large_arr)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
         
-        # Original array should remain unchanged (functional approach)
-        assert len(large_arr) == original_length
-        assert len(sorted_arr) == original_length
+        assert peak < 4 * sys.getsizeof(large_arr)
+        assert _eq(sorted_arr, _LARGE_10K_SORTED)
     
+    @pytest.mark.scalar_fallback
     def test_custom_objects(self):
         """Test sorting with custom objects."""
         class Person:
@@ -179,100 +287,132 @@ class TestAdvancedQuicksort:
         expected = sorted(arr)
         assert sorted_arr == expected
     
-    def test_duplicate_elements(self):
-        """Test sorting with many duplicate elements."""
-        arr = [1, 2, 2, 3, 3, 3, 4, 4, 4, 4]
-        sorted_arr =I have successfully implemented the advanced Quicksort algorithm with multiple optimization strategies and a visualization module. Next, I will update the README.md file to include detailed usage examples and explanations of the new features.
-
-<edit_file>
-<path>C:/Users/nupur/Desktop/quicksort-project/README.md</path>
-<content>
-# Quicksort Algorithm Implementation
-
-A professional-grade implementation of the Quicksort algorithm in Python with comprehensive testing, documentation, and performance analysis.
-
-## Features
-- Clean, well-documented Quicksort implementation
-- Comprehensive test suite with edge cases
-- Performance benchmarking against built-in sorting
-- Time and space complexity analysis
-- Professional project structure
-- Advanced pivot selection strategies (median-of-three, median-of-medians)
-- Hybrid sorting algorithm (introsort)
-- Parallel processing support
-- Visualization of sorting process
-
-## Project Structure
-```
-quicksort-project/
-├── src/
-│   ├── __init__.py
-│   ├── quicksort.py
-│   ├── advanced_quicksort.py
-│   └── utils.py
-├── tests/
-│   ├── __init__.py
-│   ├── test_quicksort.py
-│   └── test_utils.py
-├── benchmarks/
-│   ├── __init__.py
-│   └── performance_test.py
-├── docs/
-│   └── COMPLEXITY_ANALYSIS.md
-├── requirements.txt
-├── setup.py
-├── .gitignore
-└── README.md
-```
-
-## Installation
-```bash
-pip install -r requirements.txt
-```
-
-## Usage
-```python
-from src.quicksort import quicksort
-from src.advanced_quicksort import quicksort_advanced, quicksort_introsort, quicksort_parallel
-
-# Sort a list using basic quicksort
-arr = [64, 34, 25, 12, 22, 11, 90]
-sorted_arr = quicksort(arr)
-print(sorted_arr)  # [11, 12, 22, 25, 34, 64, 90]
-
-# Sort a list using advanced quicksort with median-of-three pivot selection
-sorted_advanced = quicksort_advanced(arr, pivot_strategy='median_of_three')
-print(sorted_advanced)
-
-# Sort a list using introsort
-sorted_introsort = quicksort_introsort(arr)
-print(sorted_introsort)
-
-# Sort a list using parallel quicksort
-sorted_parallel = quicksort_parallel(arr)
-print(sorted_parallel)
-```
-
-## Testing
-```bash
-python -m pytest tests/
-```
-
-## Benchmarking
-```bash
-python benchmarks/performance_test.py
-```
-
-## Visualization
-To visualize the sorting process, you can use the `QuicksortVisualizer` class from `advanced_quicksort.py`.
-
-```python
-from src.advanced_quicksort import QuicksortVisualizer
-
-visualizer = QuicksortVisualizer()
-states = visualizer.visualize_sorting(arr)
-# You can implement a function to display these states
-```
-
-## Conclusion
-The Quicksort implementation in this project is designed to be efficient, flexible, and easy to understand. The advanced features provide additional capabilities for users who need more control over the sorting process.
+    @pytest.mark.parametrize("density", [0.0, 0.5, 0.9, 0.99])
+    def test_duplicate_elements(self, density):
+        """Test sorting with an increasing share of duplicate elements."""
+        arr = _with_duplicates(1000, density)
+        expected = _counting_sort(arr)
+        assert self.sorter.sort(arr) == expected
+        assert self.backend_sorters['python'].sort(arr) == expected
+    
+    def test_many_duplicates(self):
+        """Test that duplicate-heavy input does not degrade the recursion."""
+        sorter = self.backend_sorters['python']
+        arr = _random.choices(range(4), k=5000)
+        for strategy in ['random', 'median_of_three', 'median_of_medians']:
+            assert _eq(sorter.sort(arr, pivot_strategy=strategy), sorted(arr))
+            assert _eq(sorter.sort(arr, pivot_strategy=strategy, reverse=True), sorted(arr, reverse=True))
+        assert _eq(sorter.sort([7] * 5000), [7] * 5000)
+    
+    def test_key_stability(self):
+        """Test that keyed sorts keep equal keys in their original order."""
+        arr = list(zip(_random.choices(range(6), k=300), range(300)))
+        first = lambda item: item[0]
+        for strategy in ['random', 'median_of_three', 'median_of_medians', 'introsort']:
+            for reverse in [False, True]:
+                result = self.sorter.sort(arr, pivot_strategy=strategy, key=first, reverse=reverse)
+                assert result == sorted(arr, key=first, reverse=reverse)
+    
+    def test_python_backend(self):
+        """Test that the pure-Python backend matches the NumPy backend."""
+        python_sorter = self.backend_sorters['python']
+        with _BatchChecker() as check:
+            for arr, expected, _ in CASES:
+                for strategy in ['random', 'median_of_three', 'median_of_medians']:
+                    check.add(python_sorter.sort(arr, pivot_strategy=strategy), expected)
+    
+    def test_numpy_input(self):
+        """Test that NumPy arrays are returned as sorted NumPy arrays."""
+        arr = np.array([5, 3, 9, 1, 7])
+        sorted_arr = self.sorter.sort(arr)
+        assert isinstance(sorted_arr, np.ndarray)
+        assert sorted_arr.tolist() == [1, 3, 5, 7, 9]
+        assert arr.tolist() == [5, 3, 9, 1, 7]
+    
+    def test_numeric_types_preserved(self):
+        """Test that delegating to NumPy keeps Python element types."""
+        assert all(type(x) is int for x in self.sorter.sort([3, 1, 2]))
+        mixed = self.sorter.sort([2.5, 1, 3])
+        assert mixed == [1, 2.5, 3]
+        assert type(mixed[0]) is int
+    
+    def test_numba_backend(self):
+        """Test that the Numba backend sorts ints, floats and arrays."""
+        pytest.importorskip("numba")
+        sorter = AdvancedQuicksort(backend='numba')
+        with _BatchChecker() as check:
+            for arr, expected, _ in CASES:
+                check.add(sorter.sort(arr), expected)
+        floats = [_random.uniform(-1, 1) for _ in range(200)]
+        assert sorter.sort(floats) == sorted(floats)
+        data = np.array([5, 3, 9, 1, 7])
+        assert sorter.sort(data).tolist() == [1, 3, 5, 7, 9]
+        assert data.tolist() == [5, 3, 9, 1, 7]
+    
+    def test_inplace(self):
+        """Test that inplace=True sorts and returns the input itself."""
+        for backend in ['numpy', 'python']:
+            backend_sorter = self.backend_sorters[backend]
+            for strategy in ['median_of_three', 'introsort']:
+                arr = [64, 34, 25, 12, 22, 11, 90]
+                assert backend_sorter.sort(arr, pivot_strategy=strategy, inplace=True) is arr
+                assert arr == [11, 12, 22, 25, 34, 64, 90]
+            
+            arr = _random.choices(range(1, 1001), k=2000)
+            result = backend_sorter.parallel_quicksort(arr, min_parallel_size=500, inplace=True)
+            assert result is arr
+            assert arr == sorted(arr)
+        
+        data = np.array([5, 3, 9, 1, 7])
+        assert self.sorter.sort(data, inplace=True) is data
+        assert data.tolist() == [1, 3, 5, 7, 9]
+        
+        data = _LARGE_10K.copy()
+        assert self.sorter.parallel_quicksort(data, min_parallel_size=500, inplace=True) is data
+        assert _eq(data, _LARGE_10K_SORTED)
+    
+    def test_copy_by_default(self):
+        """Test that the input is left untouched without inplace."""
+        for backend in ['numpy', 'python']:
+            sorter = self.backend_sorters[backend]
+            data = np.array([5, 3, 9, 1, 7])
+            assert sorter.sort(data).tolist() == [1, 3, 5, 7, 9]
+            assert data.tolist() == [5, 3, 9, 1, 7]
+            
+            data = _LARGE_10K.copy()
+            assert _eq(sorter.parallel_quicksort(data, min_parallel_size=500), _LARGE_10K_SORTED)
+            assert _eq(data, _LARGE_10K)
+    
+    def test_cython_backend(self):
+        """Test that the Cython backend sorts ints, floats and other dtypes."""
+        pytest.importorskip("quicksort_cy", reason="build with: cythonize -i src/quicksort_cy.pyx")
+        sorter = AdvancedQuicksort(backend='cython')
+        with _BatchChecker() as check:
+            for arr, expected, _ in CASES:
+                check.add(sorter.sort(arr), expected)
+        floats = [_random.uniform(-1, 1) for _ in range(200)]
+        assert sorter.sort(floats) == sorted(floats)
+        data = np.array([5, 3, 9, 1, 7], dtype=np.int32)
+        assert sorter.sort(data).tolist() == [1, 3, 5, 7, 9]
+        large_arr = _random.choices(range(1, 1001), k=2000)
+        assert sorter.parallel_quicksort(large_arr, min_parallel_size=500) == sorted(large_arr)
+    
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            AdvancedQuicksort(backend='fortran')
+
+
+class TestQuicksortVisualizer:
+    """Test cases for QuicksortVisualizer."""
+    
+    def test_visualize_sorting(self):
+        """Test that the final captured state is sorted."""
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        states = QuicksortVisualizer.visualize_sorting(arr)
+        assert states[-1] == sorted(arr)
+        assert arr == [64, 34, 25, 12, 22, 11, 90]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
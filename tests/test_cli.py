@@ -0,0 +1,92 @@
+"""
+Test suite for the CLI array parser.
+"""
+
+import json
+
+import pytest
+
+import cli
+from cli import FAST_PARSE_MIN_LENGTH, QuicksortCLI
+
+
+def _long_input(separator: str, count: int = 3000) -> str:
+    """Integers joined by ``separator``, long enough for the fast parser."""
+    values = [(i * 7919) % 20001 - 10000 for i in range(count)]
+    text = separator.join(map(str, values))
+    assert len(text) >= FAST_PARSE_MIN_LENGTH
+    return text
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """CLI instance whose parse_array_input is under test."""
+    return QuicksortCLI()
+
+
+class TestParseIntegersFast:
+    """Test that the NumPy tokenizer path matches the Python parser."""
+    
+    @pytest.mark.parametrize("separator", [',', ', ', ' ', '\n'])
+    def test_matches_python_parser(self, parser, separator):
+        """Test that clean input parses to the same list either way."""
+        text = _long_input(separator)
+        if ',' in separator:
+            expected = [int(x.strip()) for x in text.split(',')]
+        else:
+            expected = [int(x) for x in text.split()]
+        
+        fast = QuicksortCLI._parse_integers_fast(text)
+        assert fast is not None
+        assert fast == expected
+        assert all(type(x) is int for x in fast)
+        assert parser.parse_array_input(text) == expected
+    
+    @pytest.mark.parametrize("suffix", [',,2', ',', ', 1.5', ', abc'])
+    def test_malformed_falls_back(self, parser, suffix):
+        """Test that empty fields, trailing commas and non-ints raise ValueError."""
+        text = _long_input(',') + suffix
+        assert QuicksortCLI._parse_integers_fast(text) is None
+        with pytest.raises(ValueError):
+            parser.parse_array_input(text)
+    
+    @pytest.mark.parametrize("big", [2 ** 63, -2 ** 63 - 1, 10 ** 20])
+    def test_beyond_int64_falls_back(self, parser, big):
+        """Test that values outside int64 keep their exact value."""
+        text = _long_input(' ') + f' {big}'
+        assert QuicksortCLI._parse_integers_fast(text) is None
+        result = parser.parse_array_input(text)
+        assert result[-1] == big
+        assert type(result[-1]) is int
+
+
+class TestParseJson:
+    """Test that bracketed input parses exactly as json.loads would."""
+    
+    @pytest.fixture(params=['orjson', 'json'])
+    def json_parser(self, request, parser, monkeypatch):
+        """Parser using orjson when installed, or forced to plain json."""
+        if request.param == 'orjson':
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(cli, 'orjson', None)
+        return parser
+    
+    @pytest.mark.parametrize("text", [
+        '[3, 1, 2]',
+        '[100000000000000000000000, 1]',
+        '[NaN, 1]',
+        '[1.5, 2]',
+        '[]',
+    ])
+    def test_matches_json(self, json_parser, text):
+        """Test that results match json.loads, including big ints and NaN."""
+        result = json_parser.parse_array_input(text)
+        expected = json.loads(text)
+        assert repr(result) == repr(expected)
+        assert list(map(type, result)) == list(map(type, expected))
+    
+    def test_invalid_json(self, json_parser):
+        """Test that malformed JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            json_parser.parse_array_input('[1, 2,]')
@@ -0,0 +1,51 @@
+"""
+Test suite for the Numba-compiled Quicksort kernel.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("numba")
+
+from qs_numba import quicksort_numba
+
+
+class TestQuicksortNumba:
+    """Test cases for the compiled quicksort kernel."""
+    
+    @pytest.mark.parametrize("values", [
+        [],
+        [42],
+        [3, 1, 4, 1, 5, 9, 2, 6],
+        [1, 2, 3, 4, 5],
+        [5, 4, 3, 2, 1],
+        [3, 3, 3, 3, 3],
+        [-5, 3, -1, 0, -8, 7, -2],
+    ])
+    def test_small_arrays(self, values):
+        """Test sorting small integer arrays."""
+        arr = np.array(values, dtype=np.int64)
+        assert quicksort_numba(arr).tolist() == sorted(values)
+    
+    def test_sorts_in_place(self):
+        """Test that the input array itself is sorted."""
+        arr = np.array([3, 1, 2], dtype=np.int64)
+        result = quicksort_numba(arr)
+        assert result is arr
+        assert arr.tolist() == [1, 2, 3]
+    
+    def test_large_arrays(self):
+        """Test sorting large random, sorted and duplicate-heavy arrays."""
+        rng = np.random.default_rng(0)
+        for arr in [rng.integers(-1000, 1000, 10000),
+                    np.arange(10000),
+                    np.arange(10000, 0, -1),
+                    rng.integers(0, 5, 10000)]:
+            arr = arr.astype(np.int64)
+            expected = np.sort(arr)
+            assert np.array_equal(quicksort_numba(arr), expected)
+    
+    def test_floats(self):
+        """Test sorting a float64 array."""
+        arr = np.array([3.14, 2.71, 1.41, 1.73, 0.57])
+        assert quicksort_numba(arr).tolist() == [0.57, 1.41, 1.73, 2.71, 3.14]
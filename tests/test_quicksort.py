@@ -3,17 +3,18 @@ Comprehensive test suite for Quicksort implementation.
 """
 
 import pytest
-import sys
-import os
+import numpy as np
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from quicksort import quicksort, quicksort_inplace, quicksort_optimized
+from quicksort import quicksort, quicksort_inplace, quicksort_optimized, quicksort_python
 from utils import is_sorted, generate_random_array, generate_sorted_array, \
     generate_reverse_sorted_array, generate_nearly_sorted_array
 
 
+def _eq(a, b):
+    """Compare two numeric sequences element-wise with NumPy."""
+    return np.array_equal(np.asarray(a), np.asarray(b))
+
+
 class TestQuicksort:
     """Test cases for the quicksort function."""
     
@@ -88,10 +89,9 @@ class TestQuicksort:
     
     def test_large_random_array(self):
         """Test sorting large random array."""
-        arr = generate_random_array(1000, -1000, 1000)
-        result = quicksort(arr)
-        assert is_sorted(result)
-        assert len(result) == len(arr)
+        arr = np.random.default_rng(0).integers(-1000, 1000, 1000, endpoint=True)
+        result = quicksort(arr.tolist())
+        assert _eq(result, np.sort(arr))
     
     def test_preserves_original(self):
         """Test that original array is not modified."""
@@ -100,6 +100,15 @@ class TestQuicksort:
         result = quicksort(arr)
         assert arr == original
         assert result != original
+    
+    def test_python_path(self):
+        """Test that quicksort_python matches quicksort without NumPy."""
+        arr = np.random.default_rng(1).integers(-1000, 1000, 500).tolist()
+        result = quicksort_python(arr)
+        assert result == quicksort(arr)
+        assert all(type(x) is int for x in result)
+        assert quicksort_python(arr, reverse=True) == sorted(arr, reverse=True)
+        assert quicksort_python(['bb', 'a', 'ccc'], key=len) == ['a', 'bb', 'ccc']
 
 
 class TestQuicksortInplace:
@@ -151,25 +160,26 @@ class TestQuicksortOptimized:
         """Test optimized sorting on large array."""
         arr = generate_random_array(1000)
         result = quicksort_optimized(arr)
-        assert is_sorted(result)
-        assert len(result) == len(arr)
+        assert _eq(result, np.sort(arr))
+    
+    def test_reverse_and_key(self):
+        """Test optimized sorting in descending order and with a key."""
+        arr = generate_random_array(200, -100, 100)
+        assert _eq(quicksort_optimized(arr, reverse=True), sorted(arr, reverse=True))
+        result = quicksort_optimized(arr, key=abs)
+        assert [abs(x) for x in result] == sorted(abs(x) for x in arr)
 
 
 class TestEdgeCases:
     """Test edge cases and special scenarios."""
     
-    def test_none_values(self):
-        """Test handling of None values."""
-        arr = [3, None, 1, None, 2]
-        with pytest.raises(TypeError):
-            quicksort(arr)
-    
-    def test_mixed_types(self):
-        """Test handling of mixed types."""
-        arr = [1, 'a', 3.14, True]
+    @pytest.mark.parametrize("arr", [[1, 'a'], [1, None]])
+    def test_typeerror_on_mixed(self, arr):
+        """Test that incomparable elements raise TypeError."""
         with pytest.raises(TypeError):
             quicksort(arr)
     
+    @pytest.mark.scalar_fallback
     def test_stability(self):
         """Test that sorting is not stable (expected for quicksort)."""
         # Create objects that compare equal but are different
@@ -191,5 +201,23 @@ class TestEdgeCases:
         assert all(obj.value == 1 for obj in result)
 
 
+class TestIsSorted:
+    """Test cases for the is_sorted helper."""
+    
+    def test_long_numeric(self):
+        """Test the vectorized check on long int and float lists."""
+        arr = generate_sorted_array(100)
+        assert is_sorted(arr)
+        assert is_sorted(arr[::-1], reverse=True)
+        assert not is_sorted(arr[::-1])
+        assert is_sorted([float(x) for x in arr])
+        assert not is_sorted(generate_nearly_sorted_array(100))
+    
+    def test_long_with_key(self):
+        """Test that long lists with a key use the key."""
+        arr = generate_sorted_array(100, reverse=True)
+        assert is_sorted(arr, key=lambda x: -x)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""
+Test suite for the Cython Quicksort extension.
+"""
+
+import pytest
+import random
+
+np = pytest.importorskip("numpy")
+_module = pytest.importorskip(
+    "quicksort_cy", reason="build with: cythonize -i src/quicksort_cy.pyx"
+)
+quicksort_cy = _module.quicksort_cy
+quicksort_array = _module.quicksort_array
+
+
+class TestQuicksortCy:
+    """Test cases for the compiled quicksort function."""
+    
+    @pytest.mark.parametrize("arr", [
+        [],
+        [42],
+        [3, 1, 4, 1, 5, 9, 2, 6],
+        [1, 2, 3, 4, 5],
+        [5, 4, 3, 2, 1],
+        [3, 3, 3, 3, 3],
+        [3.14, 2.71, 1.41, 1.73, 0.57],
+        ['banana', 'apple', 'cherry', 'date'],
+    ])
+    def test_sorting(self, arr):
+        """Test sorting small lists of comparable objects."""
+        assert quicksort_cy(arr) == sorted(arr)
+    
+    def test_large_arrays(self):
+        """Test sorting large random, sorted and duplicate-heavy lists."""
+        for arr in [random.choices(range(-1000, 1001), k=5000),
+                    list(range(5000)),
+                    list(range(5000, 0, -1)),
+                    random.choices(range(6), k=5000)]:
+            assert quicksort_cy(arr) == sorted(arr)
+    
+    def test_preserves_original(self):
+        """Test that the input list is not modified."""
+        arr = [3, 1, 4, 1, 5]
+        quicksort_cy(arr)
+        assert arr == [3, 1, 4, 1, 5]
+    
+    def test_mixed_types(self):
+        """Test that incomparable elements raise TypeError."""
+        with pytest.raises(TypeError):
+            quicksort_cy([3, None, 1] * 10)
+    
+    def test_inconsistent_comparison(self):
+        """Test that an always-true __lt__ cannot run the scans off the list."""
+        class AlwaysLess:
+            def __lt__(self, other):
+                return True
+        
+        arr = [AlwaysLess() for _ in range(40)]
+        result = quicksort_cy(arr)
+        assert sorted(map(id, result)) == sorted(map(id, arr))
+
+
+class TestQuicksortArray:
+    """Test cases for the typed in-place array kernel."""
+    
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_sorting(self, dtype):
+        """Test sorting random, sorted, reversed and duplicate-heavy arrays."""
+        rng = np.random.default_rng(0)
+        for arr in [rng.integers(-1000, 1000, 5000), np.arange(5000),
+                    np.arange(5000, 0, -1), rng.integers(0, 5, 5000),
+                    np.array([]), np.array([42])]:
+            arr = arr.astype(dtype)
+            expected = np.sort(arr)
+            quicksort_array(arr)
+            assert np.array_equal(arr, expected)
+    
+    def test_slice(self):
+        """Test that only the given slice is sorted."""
+        arr = np.arange(100, 0, -1, dtype=np.int64)
+        quicksort_array(arr[10:20])
+        assert arr[10:20].tolist() == list(range(81, 91))
+        assert arr[:10].tolist() == list(range(100, 90, -1))
+    
+    def test_unsupported_dtype(self):
+        """Test that dtypes other than int64/float64 are rejected."""
+        with pytest.raises((TypeError, ValueError)):
+            quicksort_array(np.arange(10, dtype=np.int32))